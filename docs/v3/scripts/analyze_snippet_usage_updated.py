@@ -5,149 +5,124 @@ Analyzes snippet usage patterns in source schemas (excluding assembled)
 FIXED: Transitive closure only for types, flags transitive fields as optimization opportunities
 """
 
+import functools
+import hashlib
 import json
 import os
+import pickle
 import re
-from collections import defaultdict, Counter
+import sys
+from collections import defaultdict, deque, Counter
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
+try:
+    # orjson is a much faster drop-in parser when available
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# On-disk snippet graph cache; bump the version when the graph format changes
+SNIPPET_GRAPH_CACHE_FILE = "snippet_graph.pkl"
+SNIPPET_GRAPH_CACHE_VERSION = 3
+
+# JSON Schema keywords whose values are literal data, never subschemas. Other
+# keys are still descended into because schemas nest refs under custom
+# containers such as "fields" and "columns".
+LITERAL_KEYS = frozenset({'enum', 'const', 'default', 'examples', 'example', 'required'})
+
+# Keywords whose values map arbitrary names to subschemas
+SCHEMA_MAP_KEYS = frozenset({'properties', 'patternProperties', '$defs', 'definitions', 'dependentSchemas'})
+
+# Keys counted by the inline-definition pattern analysis
+CONSTRAINT_KEYS = frozenset({'minimum', 'maximum'})
+PROPERTY_PATTERN_KEYS = frozenset({'entity_type', 'status', 'description', 'entity_id'})
+
+# Dense category codes used by the interned snippet graph
+CATEGORY_OTHER, CATEGORY_FIELD, CATEGORY_TYPE = 0, 1, 2
+CATEGORY_CODES = {"other": CATEGORY_OTHER, "field": CATEGORY_FIELD, "type": CATEGORY_TYPE}
+
+def _read_file_bytes(filepath):
+    """Read a whole file with one sized os.read, skipping the buffered-IO layer"""
+    fd = os.open(filepath, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        data = os.read(fd, size)
+        # Regular files almost never return short reads; finish the file if one does
+        while len(data) < size:
+            chunk = os.read(fd, size - len(data))
+            if not chunk:
+                break
+            data += chunk
+        return data
+    finally:
+        os.close(fd)
+
 def load_json_file(filepath):
     """Load and parse a JSON file safely"""
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except (json.JSONDecodeError, FileNotFoundError, UnicodeDecodeError) as e:
+        return _json_loads(_read_file_bytes(filepath))
+    except (ValueError, FileNotFoundError) as e:  # JSON and UTF-8 decode errors are ValueErrors for both parsers
         print(f"⚠️  Error loading {filepath}: {e}")
         return None
 
-def find_snippet_references(schema_content, filepath):
-    """Find all $ref references to snippets in a schema"""
-    refs = []
-    
-    # Check if this file is in a snippets directory
-    is_snippet_file = "snippets" in str(filepath)
-    
-    def extract_refs(obj, path=""):
-        if isinstance(obj, dict):
-            for key, value in obj.items():
-                current_path = f"{path}.{key}" if path else key
-                if key == "$ref" and isinstance(value, str):
-                    # Check if this is a snippet reference
-                    is_snippet_ref = False
-                    snippet_category = "other"
-                    
-                    if "snippets" in value:
-                        # Absolute or relative path containing "snippets"
-                        is_snippet_ref = True
-                        snippet_category = "field" if "/fields/" in value else "type" if "/types/" in value else "other"
-                    elif is_snippet_file and (value.startswith("./") or value.startswith("../")):
-                        # Relative reference from within snippets directory
-                        is_snippet_ref = True
-                        # Determine category from current file's path since relative refs don't show structure
-                        if "/fields/" in str(filepath):
-                            snippet_category = "field"  # Field snippet referencing another field
-                        elif "/types/" in str(filepath):
-                            snippet_category = "type"   # Type snippet referencing another type
-                    
-                    if is_snippet_ref:
-                        # Extract snippet name from path
-                        snippet_name = Path(value).stem
-                        refs.append({
-                            'snippet': snippet_name,
-                            'path': value,
-                            'location': current_path,
-                            'category': snippet_category
-                        })
-                
-                extract_refs(value, current_path)
-        elif isinstance(obj, list):
-            for i, item in enumerate(obj):
-                extract_refs(item, f"{path}[{i}]")
-    
-    if schema_content:
-        extract_refs(schema_content)
-    
-    return refs
+def iter_json_files(root, exclude=()):
+    """Yield paths (as str) of all .json files under root, in rglob order
+    
+    Directories and files whose name contains any of the exclude tokens are
+    pruned without being descended into.
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        subdirs = []
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                name = entry.name
+                if any(token in name for token in exclude):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif name.endswith(".json"):
+                    yield entry.path
+        # Files of a directory come before its subdirectories, as with Path.rglob
+        stack.extend(reversed(subdirs))
 
-def build_snippet_dependency_graph(snippets_dir):
-    """Build a graph of snippet-to-snippet dependencies with categories"""
-    snippet_deps = defaultdict(set)  # snippet -> set of snippets it references
-    snippet_files = {}  # snippet_name -> file_path
-    snippet_categories = {}  # snippet_name -> category (field/type/other)
-    
-    if not snippets_dir.exists():
-        return snippet_deps, snippet_files, snippet_categories
-    
-    # Load all snippet files
-    for snippet_file in snippets_dir.rglob("*.json"):
-        snippet_name = snippet_file.stem
-        snippet_files[snippet_name] = snippet_file
-        
-        # Determine category from path
-        if "/fields/" in str(snippet_file):
-            snippet_categories[snippet_name] = "field"
-        elif "/types/" in str(snippet_file):
-            snippet_categories[snippet_name] = "type"
+@functools.lru_cache(maxsize=None)
+def _basename(path):
+    """Cheap string-level equivalent of Path(path).name for report rendering"""
+    return path.rpartition(os.sep)[2] or path
+
+def _stem(ref):
+    """String-level equivalent of Path(ref).stem for $ref values"""
+    name = ref.rstrip('/').rpartition('/')[2]
+    dot = name.rfind('.')
+    return name[:dot] if 0 < dot < len(name) - 1 else name
+
+def _materialize_path(location):
+    """Render a (parent, key) location chain as a dotted/indexed path string"""
+    segments = []
+    while location is not None:
+        location, segment = location
+        segments.append(segment)
+    
+    path = ""
+    for segment in reversed(segments):
+        if isinstance(segment, int):
+            path = f"{path}[{segment}]"
         else:
-            snippet_categories[snippet_name] = "other"
-        
-        content = load_json_file(snippet_file)
-        if content:
-            # Find references to other snippets
-            refs = find_snippet_references(content, snippet_file)
-            for ref in refs:
-                snippet_deps[snippet_name].add(ref['snippet'])
-    
-    return snippet_deps, snippet_files, snippet_categories
-
-def find_transitive_type_usage(direct_used_snippets, snippet_deps, snippet_categories):
-    """Find all TYPE snippets that are transitively used. Fields should be directly referenced."""
-    used_snippets = set(direct_used_snippets)
-    transitive_types = set()
-    changed = True
-    
-    # Keep expanding until no new snippets are found
-    while changed:
-        changed = False
-        new_snippets = set()
-        
-        for used_snippet in used_snippets:
-            for referenced_snippet in snippet_deps.get(used_snippet, set()):
-                if referenced_snippet not in used_snippets:
-                    # Only add types transitively - fields should be direct
-                    if snippet_categories.get(referenced_snippet) == "type":
-                        new_snippets.add(referenced_snippet)
-                        transitive_types.add(referenced_snippet)
-                        changed = True
-        
-        used_snippets.update(new_snippets)
-    
-    return used_snippets, transitive_types
+            path = f"{path}.{segment}" if path else segment
+    return path
 
-def find_transitive_field_issues(direct_used_snippets, snippet_deps, snippet_categories):
-    """Find fields that are only used transitively (optimization opportunities)"""
-    transitive_field_issues = set()
-    
-    # Find all snippets reachable from direct usage
-    all_reachable = set(direct_used_snippets)
-    changed = True
-    
-    while changed:
-        changed = False
-        for snippet in list(all_reachable):
-            for referenced in snippet_deps.get(snippet, set()):
-                if referenced not in all_reachable:
-                    all_reachable.add(referenced)
-                    changed = True
-                    # If it's a field reached transitively, flag it
-                    if snippet_categories.get(referenced) == "field" and referenced not in direct_used_snippets:
-                        transitive_field_issues.add(referenced)
+def scan_schema(schema_content, filepath):
+    """Find snippet $refs and count inline definitions in a single traversal
     
-    return transitive_field_issues
-
-def count_inline_definitions(schema_content):
-    """Count inline type definitions that could potentially be snippets"""
+    Returns (refs, inline_count, patterns) where refs lists snippet references
+    and inline_count/patterns describe inline definitions that could
+    potentially be snippets.
+    """
+    refs = []
     inline_count = 0
     patterns = {
         'type_definitions': 0,
@@ -156,9 +131,46 @@ def count_inline_definitions(schema_content):
         'property_patterns': 0
     }
     
-    def count_patterns(obj):
-        nonlocal inline_count
-        if isinstance(obj, dict):
+    if not schema_content:
+        return refs, inline_count, patterns
+    
+    # Classify the containing file once; relative refs inherit its category
+    filepath_str = str(filepath)
+    is_snippet_file = "snippets" in filepath_str
+    file_category = "field" if "/fields/" in filepath_str else "type" if "/types/" in filepath_str else "other"
+    
+    # Local bindings for the hot loop; JSON-loaded data is never subclassed
+    _dict, _list, _str = dict, list, str
+    append_ref = refs.append
+    
+    # Iterative pre-order walk; locations are kept as (parent, key) chains and
+    # only rendered to strings for actual snippet references. in_name_map marks
+    # dicts whose keys are property/definition names rather than keywords.
+    stack = [(schema_content, None, False)]
+    while stack:
+        obj, location, in_name_map = stack.pop()
+        obj_type = type(obj)
+        if obj_type is _str:
+            # Only string values of "$ref" keys are pushed as leaves
+            value = obj
+            if "snippets" in value:
+                # Absolute or relative path containing "snippets"
+                snippet_category = "field" if "/fields/" in value else "type" if "/types/" in value else "other"
+            elif is_snippet_file and value.startswith(("./", "../")):
+                # Relative reference from within snippets directory; category comes
+                # from the current file's path since relative refs don't show structure
+                snippet_category = file_category
+            else:
+                continue
+            
+            # Extract snippet name from path
+            append_ref({
+                'snippet': _stem(value),
+                'path': value,
+                'location': _materialize_path(location),
+                'category': snippet_category
+            })
+        elif obj_type is _dict:
             # Count type definitions
             if 'type' in obj and 'properties' in obj:
                 patterns['type_definitions'] += 1
@@ -170,25 +182,189 @@ def count_inline_definitions(schema_content):
                 inline_count += 1
             
             # Count constraint patterns
-            if 'minimum' in obj or 'maximum' in obj:
+            keys = obj.keys()
+            if not keys.isdisjoint(CONSTRAINT_KEYS):
                 patterns['constraint_patterns'] += 1
                 inline_count += 1
             
             # Count common property patterns
-            for key in ['entity_type', 'status', 'description', 'entity_id']:
-                if key in obj:
-                    patterns['property_patterns'] += 1
+            patterns['property_patterns'] += len(keys & PROPERTY_PATTERN_KEYS)
             
-            for value in obj.values():
-                count_patterns(value)
-        elif isinstance(obj, list):
-            for item in obj:
-                count_patterns(item)
+            if in_name_map:
+                # Every value of a name map is a subschema
+                children = [
+                    (value, (location, key), False) for key, value in obj.items()
+                    if type(value) in (_dict, _list)
+                ]
+            else:
+                # Skip literal-valued keywords; they never hold subschemas or refs
+                children = [
+                    (value, (location, key), key in SCHEMA_MAP_KEYS) for key, value in obj.items()
+                    if (type(value) in (_dict, _list) and key not in LITERAL_KEYS)
+                    or (key == "$ref" and type(value) is _str)
+                ]
+            stack.extend(reversed(children))
+        elif obj_type is _list:
+            children = [(item, (location, i), False) for i, item in enumerate(obj) if type(item) in (_dict, _list)]
+            stack.extend(reversed(children))
+    
+    return refs, inline_count, patterns
+
+def process_snippet(snippet_file):
+    """Load one snippet file and return its snippet references (worker entry point)"""
+    content = load_json_file(snippet_file)
+    if not content:
+        return []
+    refs, _, _ = scan_schema(content, snippet_file)
+    return refs
+
+def snippet_graph_fingerprint(snippet_paths):
+    """Hash (path, mtime, size) of every snippet file to key the graph cache"""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"v{SNIPPET_GRAPH_CACHE_VERSION}".encode())
+    for path in sorted(snippet_paths):
+        stat = os.stat(path)
+        h.update(f"{path}\0{stat.st_mtime_ns}\0{stat.st_size}\0".encode())
+    return h.hexdigest()
+
+def load_cached_snippet_graph(cache_file, fingerprint):
+    """Return the cached (deps, files, categories) if the fingerprint matches, else None"""
+    try:
+        with open(cache_file, 'rb') as f:
+            cached_fingerprint, graph = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError, AttributeError):
+        return None
+    return graph if cached_fingerprint == fingerprint else None
+
+def save_cached_snippet_graph(cache_file, fingerprint, graph):
+    """Persist the snippet graph; a failed write only costs a rebuild next run"""
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(cache_file, 'wb') as f:
+            pickle.dump((fingerprint, graph), f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError as e:
+        print(f"⚠️  Could not write snippet graph cache {cache_file}: {e}")
+
+def build_snippet_dependency_graph(snippets_dir):
+    """Build a graph of snippet-to-snippet dependencies with categories
     
-    if schema_content:
-        count_patterns(schema_content)
+    The result is cached under schemas/.cache/ and reused while no snippet
+    file has been added, removed or modified.
+    """
+    snippet_deps = defaultdict(list)  # snippet -> snippets it references (deduplicated below)
+    snippet_files = {}  # snippet_name -> file_path
+    snippet_categories = {}  # snippet_name -> category (field/type/other)
     
-    return inline_count, patterns
+    if not snippets_dir.exists():
+        return {}, snippet_files, snippet_categories
+    
+    snippet_paths = list(iter_json_files(snippets_dir))
+    cache_file = snippets_dir.parent / ".cache" / SNIPPET_GRAPH_CACHE_FILE
+    fingerprint = snippet_graph_fingerprint(snippet_paths)
+    cached = load_cached_snippet_graph(cache_file, fingerprint)
+    if cached is not None:
+        return cached
+    
+    # Load and scan all snippet files in parallel; map() keeps walk order
+    with ProcessPoolExecutor() as executor:
+        scanned = list(executor.map(process_snippet, snippet_paths, chunksize=16))
+    
+    for snippet_file, refs in zip(snippet_paths, scanned):
+        # Intern names here rather than in the workers: pickling results back
+        # from the process pool would produce fresh, non-interned copies
+        snippet_name = sys.intern(os.path.splitext(os.path.basename(snippet_file))[0])
+        snippet_files[snippet_name] = snippet_file
+        
+        # Determine category from path
+        if "/fields/" in snippet_file:
+            snippet_categories[snippet_name] = "field"
+        elif "/types/" in snippet_file:
+            snippet_categories[snippet_name] = "type"
+        else:
+            snippet_categories[snippet_name] = "other"
+        
+        # Record references to other snippets
+        for ref in refs:
+            snippet_deps[snippet_name].append(sys.intern(ref['snippet']))
+    
+    # Deduplicate once per snippet, keeping first-reference order
+    snippet_deps = {name: list(dict.fromkeys(deps)) for name, deps in snippet_deps.items()}
+    
+    graph = (snippet_deps, snippet_files, snippet_categories)
+    save_cached_snippet_graph(cache_file, fingerprint, graph)
+    return graph
+
+def partition_by_category(snippet_categories):
+    """Split snippet names into field/type/other sets in a single pass"""
+    partitions = {"field": set(), "type": set(), "other": set()}
+    for snippet, category in snippet_categories.items():
+        partitions[category].add(snippet)
+    return partitions
+
+def index_snippet_graph(snippet_deps, snippet_categories):
+    """Intern snippet names to dense ids so traversals work on ints and bytes"""
+    names = sorted(snippet_categories)
+    name2id = {name: i for i, name in enumerate(names)}
+    cat_tbl = bytearray(CATEGORY_CODES[snippet_categories[name]] for name in names)
+    # References to unknown snippets have no category and no outgoing edges, so drop them
+    deps_int = [[name2id[dep] for dep in snippet_deps.get(name, ()) if dep in name2id] for name in names]
+    return names, name2id, cat_tbl, deps_int
+
+def find_transitive_usage(direct_used_snippets, snippet_graph):
+    """Find transitive TYPE usage and transitive-only FIELD usage in one traversal
+    
+    Types are followed transitively, but only along type-to-type chains. Fields
+    should be directly referenced, so any field reachable from direct usage
+    that is not itself directly used is flagged as an optimization opportunity.
+    Returns (used_snippets, transitive_types, transitive_field_issues).
+    """
+    names, name2id, cat_tbl, deps_int = snippet_graph
+    seen = bytearray(len(names))       # reachable through any chain
+    type_seen = bytearray(len(names))  # reachable through a type-only chain
+    queue = deque()
+    for snippet in direct_used_snippets:
+        i = name2id.get(snippet)
+        if i is not None and not seen[i]:
+            seen[i] = type_seen[i] = 1
+            queue.append((i, True))
+    
+    transitive_type_ids = []
+    field_issue_ids = []
+    
+    # Worklist traversal: a snippet is expanded at most twice (once per chain
+    # kind), so each edge is still visited a constant number of times
+    while queue:
+        i, on_type_chain = queue.popleft()
+        for j in deps_int[i]:
+            is_type = cat_tbl[j] == CATEGORY_TYPE
+            if on_type_chain and is_type and not type_seen[j]:
+                type_seen[j] = 1
+                transitive_type_ids.append(j)
+                seen[j] = 1
+                queue.append((j, True))
+            elif not seen[j]:
+                seen[j] = 1
+                queue.append((j, False))
+                # Direct snippets are seeded as seen, so any field reached here is transitive-only
+                if cat_tbl[j] == CATEGORY_FIELD:
+                    field_issue_ids.append(j)
+    
+    transitive_types = {names[j] for j in transitive_type_ids}
+    transitive_field_issues = {names[j] for j in field_issue_ids}
+    return set(direct_used_snippets) | transitive_types, transitive_types, transitive_field_issues
+
+def process_schema(schema_file):
+    """Load and scan one source schema (worker entry point)
+    
+    Returns (schema_file, refs, inline_count, patterns), or None if the
+    schema is empty or could not be loaded.
+    """
+    schema_content = load_json_file(schema_file)
+    if not schema_content:
+        return None
+    
+    refs, inline_count, patterns = scan_schema(schema_content, schema_file)
+    return schema_file, refs, inline_count, patterns
 
 def analyze_schemas():
     """Main analysis function"""
@@ -206,17 +382,15 @@ def analyze_schemas():
     print(f"🔗 Found {sum(len(deps) for deps in snippet_deps.values())} snippet-to-snippet references")
     
     # Categorize snippets
-    field_snippets = {s for s, cat in snippet_categories.items() if cat == "field"}
-    type_snippets = {s for s, cat in snippet_categories.items() if cat == "type"}
-    other_snippets = {s for s, cat in snippet_categories.items() if cat == "other"}
+    snippets_by_category = partition_by_category(snippet_categories)
+    field_snippets = snippets_by_category["field"]
+    type_snippets = snippets_by_category["type"]
+    other_snippets = snippets_by_category["other"]
     
     print(f"📊 Snippet breakdown: {len(field_snippets)} fields, {len(type_snippets)} types, {len(other_snippets)} other")
     
     # Find all source schemas (excluding assembled and snippets)
-    source_schemas = []
-    for schema_file in schemas_dir.rglob("*.json"):
-        if "assembled" not in str(schema_file) and "snippets" not in str(schema_file):
-            source_schemas.append(schema_file)
+    source_schemas = list(iter_json_files(schemas_dir, exclude=("assembled", "snippets")))
     
     print(f"📄 Found {len(source_schemas)} source schemas")
     
@@ -230,41 +404,45 @@ def analyze_schemas():
     constraint_patterns = Counter()
     property_patterns = Counter()
     
-    for schema_file in source_schemas:
-        schema_content = load_json_file(schema_file)
-        if not schema_content:
+    # Load and scan schemas in parallel; workers return plain data that is aggregated here
+    with ProcessPoolExecutor() as executor:
+        scanned = list(executor.map(process_schema, source_schemas, chunksize=16))
+    
+    for result in scanned:
+        if result is None:
             continue
+        schema_file, refs, inline_count, patterns = result
         
-        # Find snippet references
-        refs = find_snippet_references(schema_content, schema_file)
+        # Record snippet references
         total_snippet_references += len(refs)
         
         for ref in refs:
-            direct_used_snippets.add(ref['snippet'])
-            snippet_usage[ref['snippet']].append({
-                'file': str(schema_file),
+            snippet_name = sys.intern(ref['snippet'])
+            direct_used_snippets.add(snippet_name)
+            snippet_usage[snippet_name].append({
+                'file': schema_file,
                 'location': ref['location'],
                 'path': ref['path'],
                 'category': ref['category']
             })
         
-        # Count inline definitions
-        inline_count, patterns = count_inline_definitions(schema_content)
+        # Record inline definitions
         total_inline_definitions += inline_count
-        schema_inline_counts[str(schema_file)] = {
+        schema_inline_counts[schema_file] = {
             'count': inline_count,
             'patterns': patterns
         }
         
         # Aggregate pattern counts
-        for pattern_type, count in patterns.items():
-            constraint_patterns[pattern_type] += count
+        constraint_patterns.update(patterns)
     
-    # Find transitive type usage (only for types)
-    all_used_snippets, transitive_types = find_transitive_type_usage(direct_used_snippets, snippet_deps, snippet_categories)
+    # Intern snippet names once for the graph traversals
+    snippet_graph = index_snippet_graph(snippet_deps, snippet_categories)
     
-    # Find transitive field issues (optimization opportunities)
-    transitive_field_issues = find_transitive_field_issues(direct_used_snippets, snippet_deps, snippet_categories)
+    # Find transitive type usage (only for types) and transitive field issues (optimization opportunities)
+    all_used_snippets, transitive_types, transitive_field_issues = find_transitive_usage(
+        direct_used_snippets, snippet_graph
+    )
     
     print(f"📊 Direct snippet usage: {len(direct_used_snippets)} snippets")
     print(f"📊 Total snippet usage (including transitive types): {len(all_used_snippets)} snippets")
@@ -287,6 +465,7 @@ def analyze_schemas():
         snippet_categories=snippet_categories,
         field_snippets=field_snippets,
         type_snippets=type_snippets,
+        other_snippets=other_snippets,
         total_schemas=len(source_schemas),
         total_references=total_snippet_references,
         total_inline=total_inline_definitions,
@@ -299,13 +478,33 @@ def analyze_schemas():
 
 def generate_report(total_snippets, direct_used_snippets, all_used_snippets, transitive_types,
                    transitive_field_issues, orphaned_snippets, snippet_usage, snippet_deps, 
-                   snippet_categories, field_snippets, type_snippets, total_schemas, 
+                   snippet_categories, field_snippets, type_snippets, other_snippets, total_schemas, 
                    total_references, total_inline, schema_inline_counts, constraint_patterns, usage_rate):
     """Generate the analysis report"""
     
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     
-    report = f"""# Updated Source Schema Snippet Usage Analysis Report
+    # Accumulate report fragments and join once at the end
+    parts = []
+    append = parts.append
+    
+    # Sort every snippet name once; sections filter this list instead of re-sorting
+    all_sorted = sorted(snippet_categories.keys() | direct_used_snippets)
+    
+    def in_sorted_order(names):
+        return [s for s in all_sorted if s in names]
+    
+    sorted_direct = in_sorted_order(direct_used_snippets)
+    sorted_transitive_fields = in_sorted_order(transitive_field_issues)
+    sorted_orphaned = in_sorted_order(orphaned_snippets)
+    
+    # Inverse dependency index: snippet -> snippets that reference it (in graph order)
+    rev_deps = defaultdict(list)
+    for s, deps in snippet_deps.items():
+        for dep in deps:
+            rev_deps[dep].append(s)
+    
+    append(f"""# Updated Source Schema Snippet Usage Analysis Report
 
 ## Executive Summary
 
@@ -325,86 +524,86 @@ def generate_report(total_snippets, direct_used_snippets, all_used_snippets, tra
 ### 1. Snippet Usage Status ({len(all_used_snippets)}/{total_snippets} snippets used)
 
 **✅ DIRECTLY USED SNIPPETS ({len(direct_used_snippets)} total):**
-"""
+""")
     
     # List directly used snippets by category
-    direct_fields = {s for s in direct_used_snippets if snippet_categories.get(s) == "field"}
-    direct_types = {s for s in direct_used_snippets if snippet_categories.get(s) == "type"}
-    direct_other = {s for s in direct_used_snippets if snippet_categories.get(s) == "other"}
+    direct_fields = direct_used_snippets & field_snippets
+    direct_types = direct_used_snippets & type_snippets
+    direct_other = direct_used_snippets & other_snippets
     
-    report += f"- **Fields** - {len(direct_fields)} snippets directly used\n"
-    for snippet in sorted(list(direct_fields)[:10]):
+    append(f"- **Fields** - {len(direct_fields)} snippets directly used\n")
+    for snippet in in_sorted_order(direct_fields)[:10]:
         usage_count = len(snippet_usage[snippet])
-        report += f"  - `{snippet}` (used {usage_count}x)\n"
+        append(f"  - `{snippet}` (used {usage_count}x)\n")
     if len(direct_fields) > 10:
-        report += f"  - ... and {len(direct_fields) - 10} more\n"
+        append(f"  - ... and {len(direct_fields) - 10} more\n")
     
-    report += f"- **Types** - {len(direct_types)} snippets directly used\n"
-    for snippet in sorted(list(direct_types)[:10]):
+    append(f"- **Types** - {len(direct_types)} snippets directly used\n")
+    for snippet in in_sorted_order(direct_types)[:10]:
         usage_count = len(snippet_usage[snippet])
-        report += f"  - `{snippet}` (used {usage_count}x)\n"
+        append(f"  - `{snippet}` (used {usage_count}x)\n")
     if len(direct_types) > 10:
-        report += f"  - ... and {len(direct_types) - 10} more\n"
+        append(f"  - ... and {len(direct_types) - 10} more\n")
     
     if direct_other:
-        report += f"- **Other** - {len(direct_other)} snippets directly used\n"
+        append(f"- **Other** - {len(direct_other)} snippets directly used\n")
     
-    report += f"""
+    append(f"""
 **🔗 TRANSITIVELY USED TYPES ({len(transitive_types)} total - CORRECT BEHAVIOR):**
-"""
+""")
     
     if transitive_types:
-        for snippet in sorted(transitive_types):
+        for snippet in in_sorted_order(transitive_types):
             # Find which snippets reference this one
-            referencing_snippets = [s for s, deps in snippet_deps.items() if snippet in deps and s in direct_used_snippets]
+            referencing_snippets = [s for s in rev_deps.get(snippet, ()) if s in direct_used_snippets]
             if referencing_snippets:
-                report += f"- `{snippet}` ← used by `{', '.join(referencing_snippets)}`\n"
+                append(f"- `{snippet}` ← used by `{', '.join(referencing_snippets)}`\n")
             else:
-                report += f"- `{snippet}` ← transitive chain\n"
+                append(f"- `{snippet}` ← transitive chain\n")
     else:
-        report += "- None (all type snippets are directly referenced)\n"
+        append("- None (all type snippets are directly referenced)\n")
     
-    report += f"""
+    append(f"""
 **⚠️ TRANSITIVELY USED FIELDS ({len(transitive_field_issues)} total - MEDIUM PRIORITY OPTIMIZATION):**
-"""
+""")
     
     if transitive_field_issues:
-        report += "**These fields should be directly referenced by schemas, not through other snippets:**\n"
-        for snippet in sorted(transitive_field_issues):
+        append("**These fields should be directly referenced by schemas, not through other snippets:**\n")
+        for snippet in sorted_transitive_fields:
             # Find which snippets reference this one
-            referencing_snippets = [s for s, deps in snippet_deps.items() if snippet in deps]
+            referencing_snippets = rev_deps.get(snippet, [])
             if referencing_snippets:
-                report += f"- `{snippet}` ← currently used via `{', '.join(referencing_snippets)}`\n"
+                append(f"- `{snippet}` ← currently used via `{', '.join(referencing_snippets)}`\n")
             else:
-                report += f"- `{snippet}` ← indirect usage\n"
+                append(f"- `{snippet}` ← indirect usage\n")
     else:
-        report += "- None! All field snippets are properly directly referenced ✅\n"
+        append("- None! All field snippets are properly directly referenced ✅\n")
     
-    report += f"""
+    append(f"""
 **🔍 TRULY ORPHANED SNIPPETS ({len(orphaned_snippets)} total):**
-"""
+""")
     
     if orphaned_snippets:
-        orphaned_fields = {s for s in orphaned_snippets if snippet_categories.get(s) == "field"}
-        orphaned_types = {s for s in orphaned_snippets if snippet_categories.get(s) == "type"}
-        orphaned_other = {s for s in orphaned_snippets if snippet_categories.get(s) == "other"}
+        orphaned_fields = orphaned_snippets & field_snippets
+        orphaned_types = orphaned_snippets & type_snippets
+        orphaned_other = orphaned_snippets & other_snippets
         
         if orphaned_fields:
-            report += f"**Orphaned Fields ({len(orphaned_fields)}):**\n"
-            for snippet in sorted(orphaned_fields):
-                report += f"- `{snippet}`\n"
+            append(f"**Orphaned Fields ({len(orphaned_fields)}):**\n")
+            for snippet in in_sorted_order(orphaned_fields):
+                append(f"- `{snippet}`\n")
         
         if orphaned_types:
-            report += f"**Orphaned Types ({len(orphaned_types)}):**\n"
-            for snippet in sorted(orphaned_types):
-                report += f"- `{snippet}`\n"
+            append(f"**Orphaned Types ({len(orphaned_types)}):**\n")
+            for snippet in in_sorted_order(orphaned_types):
+                append(f"- `{snippet}`\n")
         
         if orphaned_other:
-            report += f"**Orphaned Other ({len(orphaned_other)}):**\n"
-            for snippet in sorted(orphaned_other):
-                report += f"- `{snippet}`\n"
+            append(f"**Orphaned Other ({len(orphaned_other)}):**\n")
+            for snippet in in_sorted_order(orphaned_other):
+                append(f"- `{snippet}`\n")
     else:
-        report += "- None! All snippets are being used ✅\n"
+        append("- None! All snippets are being used ✅\n")
     
     # Top schemas with inline definitions
     top_inline_schemas = sorted(
@@ -413,24 +612,24 @@ def generate_report(total_snippets, direct_used_snippets, all_used_snippets, tra
         reverse=True
     )[:10]
     
-    report += f"""
+    append(f"""
 ### 2. Source Schemas with Most Inline Definitions
 
 **Top Candidates for Optimization:**
-"""
+""")
     
     for i, (schema_path, count) in enumerate(top_inline_schemas, 1):
-        schema_name = Path(schema_path).name
-        report += f"{i}. `{schema_name}` - {count} inline definitions\n"
+        schema_name = _basename(schema_path)
+        append(f"{i}. `{schema_name}` - {count} inline definitions\n")
     
-    report += f"""
+    append(f"""
 ### 3. Pattern Analysis
 
 **Constraint Patterns:**
-"""
+""")
     
     for pattern_type, count in constraint_patterns.most_common():
-        report += f"- `{pattern_type}` - {count} occurrences\n"
+        append(f"- `{pattern_type}` - {count} occurrences\n")
     
     # Most used snippets
     most_used = sorted(
@@ -439,104 +638,104 @@ def generate_report(total_snippets, direct_used_snippets, all_used_snippets, tra
         reverse=True
     )[:10]
     
-    report += f"""
+    append(f"""
 ### 4. Most Referenced Snippets
 
 **Top 10 Most Used Snippets:**
-"""
+""")
     
     for snippet, count in most_used:
         category = snippet_categories.get(snippet, "unknown")
-        report += f"- `{snippet}` ({category}) - used {count} times\n"
+        append(f"- `{snippet}` ({category}) - used {count} times\n")
     
     # Snippet dependency analysis
-    report += f"""
+    append(f"""
 ### 5. Snippet Dependency Chains
 
 **Valid type-to-type dependencies:**
-"""
+""")
     
     type_deps = {s: deps for s, deps in snippet_deps.items() 
-                if snippet_categories.get(s) == "type" and deps}
+                if s in type_snippets and deps}
     
-    for snippet in sorted(type_deps.keys()):
+    for snippet in in_sorted_order(type_deps):
         deps = ', '.join(f"`{dep}`" for dep in sorted(type_deps[snippet]))
-        report += f"- `{snippet}` → {deps}\n"
+        append(f"- `{snippet}` → {deps}\n")
     
     # Field dependencies (should be minimal)
     field_deps = {s: deps for s, deps in snippet_deps.items() 
-                 if snippet_categories.get(s) == "field" and deps}
+                 if s in field_snippets and deps}
     
     if field_deps:
-        report += f"""
+        append(f"""
 **Field-to-other dependencies (review these):**
-"""
-        for snippet in sorted(field_deps.keys()):
+""")
+        for snippet in in_sorted_order(field_deps):
             deps = ', '.join(f"`{dep}`" for dep in sorted(field_deps[snippet]))
-            report += f"- `{snippet}` → {deps}\n"
+            append(f"- `{snippet}` → {deps}\n")
     
-    report += f"""
+    append(f"""
 ## Detailed Usage Analysis
 
 ### Direct Snippet Usage Details
-"""
+""")
     
-    for snippet in sorted(direct_used_snippets):
+    for snippet in sorted_direct:
         usages = snippet_usage[snippet]
         category = snippet_categories.get(snippet, "unknown")
-        report += f"""
+        append(f"""
 #### `{snippet}` ({category}, used {len(usages)} times)
-"""
+""")
         for usage in usages[:5]:  # Show first 5 usages
-            file_name = Path(usage['file']).name
-            report += f"- `{file_name}` at `{usage['location']}`\n"
+            file_name = _basename(usage['file'])
+            append(f"- `{file_name}` at `{usage['location']}`\n")
         
         if len(usages) > 5:
-            report += f"- ... and {len(usages) - 5} more usages\n"
+            append(f"- ... and {len(usages) - 5} more usages\n")
     
-    report += f"""
+    append(f"""
 ## Recommendations
 
 ### Priority 1: Address Remaining {len(orphaned_snippets)} Orphaned Snippets
-"""
+""")
     
     if orphaned_snippets:
-        report += "**Consider removing or finding uses for:**\n"
-        for snippet in sorted(orphaned_snippets):
+        append("**Consider removing or finding uses for:**\n")
+        for snippet in sorted_orphaned:
             category = snippet_categories.get(snippet, "unknown")
-            report += f"- `{snippet}` ({category}) - Review if still needed\n"
+            append(f"- `{snippet}` ({category}) - Review if still needed\n")
     else:
-        report += "✅ No orphaned snippets! Excellent snippet utilization.\n"
+        append("✅ No orphaned snippets! Excellent snippet utilization.\n")
     
-    report += f"""
+    append(f"""
 ### Priority 2: Fix {len(transitive_field_issues)} Transitive Field Usage (Medium Priority)
 **Fields should be directly referenced by schemas, not through other snippets:**
-"""
+""")
     
     if transitive_field_issues:
-        for snippet in sorted(transitive_field_issues):
-            report += f"- `{snippet}` - Make schemas reference this directly\n"
+        for snippet in sorted_transitive_fields:
+            append(f"- `{snippet}` - Make schemas reference this directly\n")
     else:
-        report += "✅ All fields are properly directly referenced.\n"
+        append("✅ All fields are properly directly referenced.\n")
     
-    report += f"""
+    append(f"""
 ### Priority 3: Optimize High-Inline Schemas
 **Focus on schemas with most inline definitions for snippet extraction:**
-"""
+""")
     
     for i, (schema_path, count) in enumerate(top_inline_schemas[:5], 1):
-        schema_name = Path(schema_path).name
-        report += f"{i}. `{schema_name}` - {count} inline definitions\n"
+        schema_name = _basename(schema_path)
+        append(f"{i}. `{schema_name}` - {count} inline definitions\n")
     
-    report += f"""
+    append(f"""
 ### Priority 4: Pattern Consolidation
 **Common patterns that could be standardized:**
-"""
+""")
     
     for pattern_type, count in constraint_patterns.most_common(5):
-        report += f"- `{pattern_type}` appears {count} times - consider snippet consolidation\n"
+        append(f"- `{pattern_type}` appears {count} times - consider snippet consolidation\n")
     
-    report += f"""
+    append(f"""
 ## Success Metrics
 
 **Current Status:**
@@ -559,9 +758,9 @@ def generate_report(total_snippets, direct_used_snippets, all_used_snippets, tra
 ---
 
 *Generated by updated snippet analysis script (transitive types only) on {timestamp}*
-"""
+""")
     
-    return report
+    return ''.join(parts)
 
 if __name__ == "__main__":
     try:
@@ -30,20 +30,52 @@ with validation against the assembled JSON schemas in /json folder.
 import sys
 import os
 import json
+import functools
 import importlib
-import inspect
+import importlib.util
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import get_type_hints, get_origin, get_args, Any, Dict, List
-from pydantic import BaseModel
-from pydantic.fields import FieldInfo
+from typing import ForwardRef, get_type_hints, get_origin, get_args, Any, Dict, List
+
+try:
+    # orjson is a much faster drop-in for load/dump when available
+    import orjson
+except ImportError:
+    orjson = None
+
+def json_loads(data):
+    """Parse JSON from bytes or str."""
+    return orjson.loads(data) if orjson else json.loads(data)
+
+def json_dumps(obj, default=None):
+    """Serialize to indented UTF-8 JSON bytes."""
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=default)
+    return json.dumps(obj, indent=2, default=default).encode('utf-8')
 
 # Add the familiar_schemas package to the path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src" / "familiar_schemas"))
 # Also add current working directory for generated modules
 sys.path.insert(0, ".")
 
-def get_rust_type(python_type, field_info=None):
-    """Convert Python type annotations to Rust types."""
+@functools.lru_cache(maxsize=None)
+def _cached_type_hints(model_class):
+    """Resolve a model's type hints once; nested classes are seen from several modules."""
+    return get_type_hints(model_class)
+
+def _is_unresolved(annotation) -> bool:
+    """Whether an annotation is (or contains) a forward reference Pydantic has not resolved.
+    
+    Deferred builds and not-yet-defined classes leave these as ForwardRef
+    objects or plain strings, e.g. ``List[ForwardRef('Bond')]``.
+    """
+    if annotation is None or isinstance(annotation, (ForwardRef, str)):
+        return True
+    return any(_is_unresolved(arg) for arg in get_args(annotation))
+
+@functools.lru_cache(maxsize=4096)
+def get_rust_type(python_type):
+    """Convert Python type annotations to Rust types (memoized per annotation)."""
     if python_type is str:
         return "String"
     elif python_type is int:
@@ -66,11 +98,15 @@ def get_rust_type(python_type, field_info=None):
 def extract_field_info(model_class):
     """Extract field information from a Pydantic model."""
     fields = []
-    type_hints = get_type_hints(model_class)
     
     for field_name, field_info in model_class.model_fields.items():
-        python_type = type_hints.get(field_name, Any)
-        rust_type = get_rust_type(python_type, field_info)
+        # Pydantic v2 stores the resolved annotation on the FieldInfo; only
+        # fall back to (cached) get_type_hints when it is missing or still
+        # holds forward references
+        python_type = field_info.annotation
+        if _is_unresolved(python_type):
+            python_type = _cached_type_hints(model_class).get(field_name, Any)
+        rust_type = get_rust_type(python_type)
         
         field_data = {
             "name": field_name,
@@ -95,6 +131,83 @@ def extract_field_info(model_class):
     
     return fields
 
+def _defer_model_builds():
+    """Skip core-schema construction for models imported from here on.
+    
+    Only ``model_fields`` and type hints are introspected, never validation, so
+    building a validator for every generated class is wasted import time.
+    """
+    from pydantic import BaseModel
+    
+    model_config = getattr(BaseModel, 'model_config', None)
+    if model_config is not None:  # Pydantic v2 only
+        model_config['defer_build'] = True
+
+def load_generated_module(category_name, module_name):
+    """Load ``generated.pydantic.<category>.<module>`` straight from its file.
+    
+    The category package is imported once so its ``__init__`` runs a single
+    time; modules already in ``sys.modules`` (including any the package
+    imported) are reused as-is, and only the rest are loaded from the file.
+    """
+    fullname = f'generated.pydantic.{category_name}.{module_name}'
+    module = sys.modules.get(fullname)
+    if module is not None:
+        return module
+    
+    # The package __init__ may import the module itself; never execute it twice
+    importlib.import_module(f'generated.pydantic.{category_name}')
+    module = sys.modules.get(fullname)
+    if module is not None:
+        return module
+    
+    py_file = Path("generated/pydantic") / category_name / f"{module_name}.py"
+    spec = importlib.util.spec_from_file_location(fullname, py_file)
+    if spec is None or not py_file.is_file():
+        raise ImportError(f"No module named '{fullname}'", name=fullname)
+    
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[fullname] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[fullname]
+        raise
+    return module
+
+def extract_models_from_module(category_name, module_name):
+    """Import one generated module and extract its Pydantic models (worker entry point).
+    
+    Returns a list of (class_name, fields, docstring) tuples in name order.
+    """
+    # Pydantic is only imported once there is something to introspect
+    from pydantic import BaseModel
+    
+    extracted = []
+    _defer_model_builds()
+    
+    try:
+        # Load the specific module from generated.pydantic
+        module = load_generated_module(category_name, module_name)
+    except ImportError as e:
+        print(f"Could not import {category_name} module {module_name}: {e}")
+        return extracted
+    
+    # Find classes in the module that are Pydantic models; one pass over the
+    # module namespace, in the same sorted order dir() would give
+    for name, attr in sorted(vars(module).items()):
+        if (isinstance(attr, type) and 
+            issubclass(attr, BaseModel) and 
+            attr is not BaseModel):
+            
+            print(f"Analyzing {category_name}: {name}")
+            try:
+                extracted.append((name, extract_field_info(attr), attr.__doc__))
+            except Exception as e:
+                print(f"Error analyzing {category_name} {name}: {e}")
+    
+    return extracted
+
 def extract_models_from_category(category_name):
     """Extract all models from a specific category (entities, components, etc.)."""
     models = {}
@@ -106,64 +219,57 @@ def extract_models_from_category(category_name):
         print(f"Category directory not found: {category_dir}")
         return models
     
-    py_files = list(category_dir.glob("*.py"))
-    print(f"Found {len(py_files)} files in {category_name}")
+    with os.scandir(category_dir) as entries:
+        py_names = [entry.name for entry in entries if entry.name.endswith(".py")]
+    print(f"Found {len(py_names)} files in {category_name}")
     
-    for py_file in py_files:
-        if py_file.name.startswith("__") or py_file.name.startswith("."):
-            continue
+    module_names = [
+        name[:-3]  # Remove .py extension
+        for name in py_names
+        if not name.startswith(("__", "."))
+    ]
+    if not module_names:
+        return models
+    
+    # Import and introspect modules in parallel; map() keeps file order so
+    # duplicate-name resolution below stays deterministic
+    with ProcessPoolExecutor() as executor:
+        extracted_per_module = list(executor.map(
+            extract_models_from_module, [category_name] * len(module_names), module_names
+        ))
+    
+    for module_name, extracted in zip(module_names, extracted_per_module):
+        for name, fields, docstring in extracted:
+            # Create unique model name to avoid duplicates
+            unique_name = name
+            if unique_name in models:
+                # Add module name to make it unique
+                unique_name = f"{name}_{module_name}"
+                print(f"    ⚠️  Duplicate name resolved: {name} → {unique_name}")
             
-        module_name = py_file.stem  # Remove .py extension
-        
-        try:
-            # Import the specific module from generated.pydantic
-            module = importlib.import_module(f'generated.pydantic.{category_name}.{module_name}')
+            # Determine correct category based on whether this is a top-level class
+            module_path = f"generated.pydantic.{category_name}.{module_name}"
             
-            # Find classes in the module that are Pydantic models
-            for name in dir(module):
-                attr = getattr(module, name)
-                if (inspect.isclass(attr) and 
-                    issubclass(attr, BaseModel) and 
-                    attr is not BaseModel):
-                    
-                    print(f"Analyzing {category_name}: {name}")
-                    try:
-                        fields = extract_field_info(attr)
-                        
-                        # Create unique model name to avoid duplicates
-                        unique_name = name
-                        if unique_name in models:
-                            # Add module name to make it unique
-                            unique_name = f"{name}_{module_name}"
-                            print(f"    ⚠️  Duplicate name resolved: {name} → {unique_name}")
-                        
-                        # Determine correct category based on whether this is a top-level class
-                        module_path = f"generated.pydantic.{category_name}.{module_name}"
-                        
-                        # If this is a nested class (not the main entity), recategorize it
-                        actual_category = category_name
-                        if category_name == "entities" and not module_path.endswith(f".{name}"):
-                            # This is a nested class in an entity file, determine its actual category
-                            if name.startswith("Components") or name.endswith("Content") or name.endswith("State"):
-                                actual_category = "components"
-                            elif name.startswith("Physics") and not name.endswith("Config"):
-                                actual_category = "components" 
-                            elif name in ["Fields", "Universal", "Infrastructure", "History", "Permissions"]:
-                                actual_category = "components"
-                            else:
-                                actual_category = "snippets"  # Default for other nested classes
-                        
-                        models[unique_name] = {
-                            "class_name": name,
-                            "category": actual_category,
-                            "module": module_path,
-                            "fields": fields,
-                            "docstring": attr.__doc__
-                        }
-                    except Exception as e:
-                        print(f"Error analyzing {category_name} {name}: {e}")
-        except ImportError as e:
-            print(f"Could not import {category_name} module {module_name}: {e}")
+            # If this is a nested class (not the main entity), recategorize it
+            actual_category = category_name
+            if category_name == "entities" and not module_path.endswith(f".{name}"):
+                # This is a nested class in an entity file, determine its actual category
+                if name.startswith("Components") or name.endswith("Content") or name.endswith("State"):
+                    actual_category = "components"
+                elif name.startswith("Physics") and not name.endswith("Config"):
+                    actual_category = "components" 
+                elif name in ["Fields", "Universal", "Infrastructure", "History", "Permissions"]:
+                    actual_category = "components"
+                else:
+                    actual_category = "snippets"  # Default for other nested classes
+            
+            models[unique_name] = {
+                "class_name": name,
+                "category": actual_category,
+                "module": module_path,
+                "fields": fields,
+                "docstring": docstring
+            }
     
     return models
 
@@ -177,11 +283,14 @@ def load_json_schemas():
         print(f"JSON schemas directory not found: {json_dir}")
         return schemas
     
-    for schema_file in json_dir.glob("*.schema.json"):
-        schema_name = schema_file.stem.replace('.schema', '')
+    with os.scandir(json_dir) as entries:
+        schema_entries = [entry for entry in entries if entry.name.endswith(".schema.json")]
+    
+    for entry in schema_entries:
+        schema_name = entry.name[:-len(".json")].replace('.schema', '')
         try:
-            with open(schema_file, 'r') as f:
-                schemas[schema_name] = json.load(f)
+            with open(entry.path, 'rb') as f:
+                schemas[schema_name] = json_loads(f.read())
             print(f"Loaded schema: {schema_name}")
         except Exception as e:
             print(f"Error loading schema {schema_name}: {e}")
@@ -253,8 +362,7 @@ def main():
     output_file = Path(__file__).parent.parent / "schemas" / "assembled" / "json_rust" / "all_pydantic_models.json"
     output_file.parent.mkdir(parents=True, exist_ok=True)
     
-    with open(output_file, 'w') as f:
-        json.dump(result, f, indent=2, default=str)
+    output_file.write_bytes(json_dumps(result, default=str))
     
     # Print summary
     print(f"\n=== FINAL SUMMARY ===")
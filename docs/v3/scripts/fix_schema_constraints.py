@@ -13,11 +13,68 @@ Usage:
 """
 
 import json
+import os
 import sys
 import argparse
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 import copy
 
+from schema_walker import walk_and_transform
+
+try:
+    # orjson is a much faster drop-in for load/dump when available
+    import orjson
+except ImportError:
+    orjson = None
+
+def json_loads(data):
+    """Parse JSON from bytes or str."""
+    return orjson.loads(data) if orjson else json.loads(data)
+
+def json_dumps(obj, indent=False):
+    """Serialize to UTF-8 JSON bytes, optionally with 2-space indentation."""
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode('utf-8')
+
+def _fix_enum_const_node(obj):
+    """Drop 'enum' from a single schema node that also has 'const'."""
+    if 'enum' in obj and 'const' in obj:
+        print(f"🔧 Fixed enum+const conflict: keeping const='{obj['const']}', removing enum")
+        # Keep const, remove enum since const is more specific
+        del obj['enum']
+
+# min/max constraints that make typify-generated constructors panic
+NUMERIC_CONSTRAINT_ORDER = ('minimum', 'maximum', 'exclusiveMinimum', 'exclusiveMaximum')
+NUMERIC_CONSTRAINTS = frozenset(NUMERIC_CONSTRAINT_ORDER)
+
+def _fix_numeric_node(obj):
+    """Strip panicking min/max constraints from a single numeric schema node."""
+    if obj.get('type') in ('number', 'integer'):
+        present = obj.keys() & NUMERIC_CONSTRAINTS
+        if present:
+            # Keep the report in a stable order
+            constraints_removed = [c for c in NUMERIC_CONSTRAINT_ORDER if c in present]
+            for constraint in constraints_removed:
+                del obj[constraint]
+
+            print(f"🔧 Fixed numeric constraints: removed {constraints_removed}")
+
+def _check_complex_node(obj):
+    """Warn about patterns in a single schema node that typify may struggle with."""
+    # Fix pattern properties that might be too complex
+    if 'patternProperties' in obj:
+        print("🔧 Found patternProperties - typify may struggle with this")
+    
+    # Fix conditional schemas (if/then/else)
+    if any(key in obj for key in ['if', 'then', 'else']):
+        print("🔧 Found conditional schema - typify may struggle with this")
+
+def _copy_schema(schema_obj):
+    """Deep-copy JSON data via a serialize/parse round-trip (much faster than copy.deepcopy)."""
+    return json_loads(json_dumps(schema_obj))
+
 def fix_enum_const_conflict(schema_obj):
     """
     Fix schemas that have both 'enum' and 'const' fields.
@@ -31,24 +88,7 @@ def fix_enum_const_conflict(schema_obj):
     
     Solution: Replace with just const since it's more specific.
     """
-    def fix_recursive(obj):
-        if isinstance(obj, dict):
-            # Fix enum+const conflicts
-            if 'enum' in obj and 'const' in obj:
-                print(f"🔧 Fixed enum+const conflict: keeping const='{obj['const']}', removing enum")
-                # Keep const, remove enum since const is more specific
-                del obj['enum']
-            
-            # Recursively fix nested objects
-            for key, value in obj.items():
-                fix_recursive(value)
-        elif isinstance(obj, list):
-            for item in obj:
-                fix_recursive(item)
-    
-    schema_copy = copy.deepcopy(schema_obj)
-    fix_recursive(schema_copy)
-    return schema_copy
+    return walk_and_transform(copy.deepcopy(schema_obj), (_fix_enum_const_node,))
 
 def fix_constrained_numerics(schema_obj):
     """
@@ -60,100 +100,87 @@ def fix_constrained_numerics(schema_obj):
     
     Solution: Keep type but remove problematic constraints.
     """
-    def fix_recursive(obj):
-        if isinstance(obj, dict):
-            # Fix constrained numeric types
-            if obj.get('type') in ['number', 'integer']:
-                constraints_removed = []
-                for constraint in ['minimum', 'maximum', 'exclusiveMinimum', 'exclusiveMaximum']:
-                    if constraint in obj:
-                        del obj[constraint]
-                        constraints_removed.append(constraint)
-                
-                if constraints_removed:
-                    print(f"🔧 Fixed numeric constraints: removed {constraints_removed}")
-            
-            # Recursively fix nested objects
-            for key, value in obj.items():
-                fix_recursive(value)
-        elif isinstance(obj, list):
-            for item in obj:
-                fix_recursive(item)
-    
-    schema_copy = copy.deepcopy(schema_obj)
-    fix_recursive(schema_copy)
-    return schema_copy
+    return walk_and_transform(copy.deepcopy(schema_obj), (_fix_numeric_node,))
 
 def fix_complex_patterns(schema_obj):
     """
     Fix other complex patterns that may cause typify issues.
     """
-    def fix_recursive(obj):
-        if isinstance(obj, dict):
-            # Fix pattern properties that might be too complex
-            if 'patternProperties' in obj:
-                print("🔧 Found patternProperties - typify may struggle with this")
-            
-            # Fix conditional schemas (if/then/else)
-            if any(key in obj for key in ['if', 'then', 'else']):
-                print("🔧 Found conditional schema - typify may struggle with this")
-            
-            # Recursively fix nested objects
-            for key, value in obj.items():
-                fix_recursive(value)
-        elif isinstance(obj, list):
-            for item in obj:
-                fix_recursive(item)
-    
-    schema_copy = copy.deepcopy(schema_obj)
-    fix_recursive(schema_copy)
-    return schema_copy
+    return walk_and_transform(copy.deepcopy(schema_obj), (_check_complex_node,))
 
-def fix_schema(schema_obj):
-    """Apply all fixes to make schema typify-compatible."""
+# Every fix is local to a single node, so all of them run in one walk
+ALL_NODE_FIXERS = (_fix_enum_const_node, _fix_numeric_node, _check_complex_node)
+
+def fix_schema_inplace(schema_obj):
+    """Apply all fixes to ``schema_obj`` in place and return it."""
     print("🔍 Analyzing schema for typify compatibility issues...")
     
-    # Apply fixes in order
-    fixed = fix_enum_const_conflict(schema_obj)
-    fixed = fix_constrained_numerics(fixed)
-    fixed = fix_complex_patterns(fixed)
-    
-    return fixed
+    # One traversal applying every fix in order at each node
+    return walk_and_transform(schema_obj, ALL_NODE_FIXERS)
+
+def fix_schema(schema_obj):
+    """Apply all fixes to make schema typify-compatible."""
+    # One fast copy; the fixes then mutate it in place
+    return fix_schema_inplace(_copy_schema(schema_obj))
 
 def process_single_schema(input_path, output_path):
     """Process a single schema file."""
     print(f"📝 Processing: {input_path}")
     
-    with open(input_path, 'r') as f:
-        schema = json.load(f)
+    with open(input_path, 'rb') as f:
+        schema = json_loads(f.read())
     
-    fixed_schema = fix_schema(schema)
+    # The freshly parsed schema is not shared, so no defensive copy is needed
+    fixed_schema = fix_schema_inplace(schema)
     
     # Ensure output directory exists
     output_path.parent.mkdir(parents=True, exist_ok=True)
     
-    with open(output_path, 'w') as f:
-        json.dump(fixed_schema, f, indent=2)
+    with open(output_path, 'wb') as f:
+        f.write(json_dumps(fixed_schema, indent=True))
     
     print(f"✅ Fixed schema saved to: {output_path}")
 
+def process_batch_entry(schema_file, output_file):
+    """Process one schema of a batch, reporting rather than raising errors (worker entry point)."""
+    try:
+        process_single_schema(schema_file, output_file)
+    except Exception as e:
+        print(f"❌ Error processing {schema_file}: {e}")
+
+def iter_json_files(root):
+    """Yield (path, relative_path) string pairs for all .json files under root.
+    
+    Walks with os.scandir so no Path objects or extra stat calls are made, and
+    builds each relative path as the walk descends.
+    """
+    stack = [(os.fspath(root), "")]
+    while stack:
+        dir_path, rel_dir = stack.pop()
+        with os.scandir(dir_path) as entries:
+            for entry in entries:
+                rel_path = rel_dir + entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append((entry.path, rel_path + os.sep))
+                elif entry.name.endswith(".json") and entry.is_file():
+                    yield entry.path, rel_path
+
 def process_batch(input_dir, output_dir):
     """Process all JSON schemas in a directory."""
-    input_path = Path(input_dir)
     output_path = Path(output_dir)
     
-    schema_files = list(input_path.glob("**/*.json"))
+    schema_files = []
+    output_files = []
+    for schema_file, rel_path in iter_json_files(input_dir):
+        schema_files.append(schema_file)
+        # Preserve directory structure
+        output_files.append(output_path / rel_path)
     print(f"📁 Found {len(schema_files)} schema files to process")
     
-    for schema_file in schema_files:
-        # Preserve directory structure
-        relative_path = schema_file.relative_to(input_path)
-        output_file = output_path / relative_path
-        
-        try:
-            process_single_schema(schema_file, output_file)
-        except Exception as e:
-            print(f"❌ Error processing {schema_file}: {e}")
+    # Files are independent; fan them out across processes
+    with ProcessPoolExecutor() as executor:
+        for _ in executor.map(process_batch_entry, schema_files, output_files, chunksize=8):
+            pass
 
 def main():
     parser = argparse.ArgumentParser(description="Fix JSON schemas for typify compatibility")
@@ -12,155 +12,272 @@ a proper multi-crate Rust workspace with correct dependency management.
 ⚡ Feature: Eliminates duplication through proper Rust architecture
 """
 
+import functools
+import hashlib
 import subprocess
 import os
 import sys
 from pathlib import Path
 import json
-import tempfile
 import shutil
 import re
-from typing import Dict, Any, List
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, List, Tuple
+
+from schema_walker import walk_and_transform
+
+try:
+    # orjson is a much faster drop-in for load/dump when available
+    import orjson
+except ImportError:
+    orjson = None
+
+def json_loads(data):
+    """Parse JSON from bytes or str."""
+    return orjson.loads(data) if orjson else json.loads(data)
+
+def json_dumps(obj):
+    """Serialize to compact UTF-8 JSON bytes (typify doesn't need indentation)."""
+    if orjson:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+# Schema extensions that make typify crash
+EXTENSIONS_TO_REMOVE = frozenset({
+    'x-infrastructure', 'category', 'source_file', 'schema_version',
+    'physics_properties', 'x-python-type', 'x-typescript-type',
+    'x-java-type', 'x-go-type', 'ui_label', 'format'
+})
+
+def _drop_typify_extensions(obj: Dict[str, Any]) -> None:
+    """Remove typify-incompatible extensions (one C-level set op per node)."""
+    for ext in obj.keys() & EXTENSIONS_TO_REMOVE:
+        del obj[ext]
+
+def _apply_rust_type_hint(obj: Dict[str, Any]) -> None:
+    """Replace an ``x-rust-type`` hint with the equivalent JSON Schema type."""
+    if 'x-rust-type' in obj:
+        rust_type = obj.pop('x-rust-type')
+        
+        # Transform schema based on rust type hints
+        if rust_type == 'f64':
+            obj['type'] = 'number'
+        elif rust_type.startswith('[f64;'):
+            obj['type'] = 'array'
+            obj['items'] = {'type': 'number'}
+            if '; 6]' in rust_type:
+                obj['minItems'] = 6
+                obj['maxItems'] = 6
+
+TYPIFY_CLEANUP_RULES = (_drop_typify_extensions, _apply_rust_type_hint)
 
 def clean_schema_for_typify(schema_data: Dict[str, Any]) -> Dict[str, Any]:
-    """Remove extensions that cause typify to crash."""
-    cleaned = json.loads(json.dumps(schema_data))
+    """Remove extensions that cause typify to crash.
     
-    extensions_to_remove = [
-        'x-infrastructure', 'category', 'source_file', 'schema_version',
-        'physics_properties', 'x-python-type', 'x-typescript-type',
-        'x-java-type', 'x-go-type', 'ui_label', 'format'
-    ]
+    Cleans ``schema_data`` in place and returns it; callers pass a freshly
+    loaded schema that is not reused afterwards.
+    """
+    return walk_and_transform(schema_data, TYPIFY_CLEANUP_RULES)
 
-    def clean_nested(obj: Any) -> Any:
-        if isinstance(obj, dict):
-            # Remove typify-incompatible extensions
-            for ext in extensions_to_remove:
-                if ext in obj:
-                    del obj[ext]
-            
-            # Process x-rust-type hints
-            if 'x-rust-type' in obj:
-                rust_type = obj['x-rust-type']
-                del obj['x-rust-type']
-                
-                # Transform schema based on rust type hints
-                if rust_type == 'f64':
-                    obj['type'] = 'number'
-                elif rust_type.startswith('[f64;'):
-                    obj['type'] = 'array'
-                    obj['items'] = {'type': 'number'}
-                    if '; 6]' in rust_type:
-                        obj['minItems'] = 6
-                        obj['maxItems'] = 6
-
-            # Recursively clean nested objects
-            for key, value in list(obj.items()):
-                obj[key] = clean_nested(value)
-
-            return obj
-        elif isinstance(obj, list):
-            return [clean_nested(item) for item in obj]
-        return obj
-
-    return clean_nested(cleaned)
+def _contains_any(*substrings: str):
+    """Compile a substring-alternation predicate (runs the scan in C)."""
+    return re.compile("|".join(map(re.escape, substrings))).search
 
-def categorize_schema(schema_name: str) -> str:
-    """Determine which crate a schema belongs to."""
-    
+def _ends_with_any(*suffixes: str):
+    """Compile a suffix-alternation predicate."""
+    return re.compile("(?:%s)$" % "|".join(map(re.escape, suffixes))).search
+
+# Crate categorization rules, checked in order; the first matching rule wins.
+# Rules overlap (e.g. "LawTable"), so precedence matters and they cannot be
+# folded into a single leftmost-match regex.
+CATEGORY_RULES = (
     # Core shared types - foundational types used everywhere
-    if schema_name in ['EntityType', 'RelationshipType', 'ThreadType', 'BondState', 
-                       'ThreadState', 'Status', 'AccessType', 'UUID', 'Timestamp']:
-        return 'types'
-    
+    ('types', frozenset({
+        'EntityType', 'RelationshipType', 'ThreadType', 'BondState',
+        'ThreadState', 'Status', 'AccessType', 'UUID', 'Timestamp'
+    }).__contains__),
     # More types - anything ending in Type, State, or Status
-    if any(schema_name.endswith(suffix) for suffix in ['Type', 'State', 'Status']):
-        return 'types'
-    
+    ('types', _ends_with_any('Type', 'State', 'Status')),
     # Physics types - physics-related shared types
-    if any(pattern in schema_name for pattern in [
+    ('physics', _contains_any(
         'Vec3', 'Vec6', 'ComplexNumber', 'NormalizedValue', 'SignedNormalizedValue',
-        'ExplorationBias', 'BondDampingFactor', 'SocialEnergyFactor', 
+        'ExplorationBias', 'BondDampingFactor', 'SocialEnergyFactor',
         'ConsolidationRateModifier', 'EmotionalVolatility', 'PhysicsProfile',
         'EmotionalValence', 'Physics', 'Quantum', 'BasePhysics'
-    ]):
-        return 'physics'
-    
+    )),
     # Component schemas - ECS components and content types
-    if any(schema_name.endswith(suffix) for suffix in [
+    ('components', _ends_with_any(
         'Content', 'Permissions', 'Config', 'Details', 'Members', 'Identity',
         'Tension', 'Reason'
-    ]) or 'Component' in schema_name:
-        return 'components'
-    
+    )),
+    ('components', _contains_any('Component')),
     # Table schemas - database tables and logs
-    if any(pattern in schema_name for pattern in [
-        '_log', 'Table', '_state_log'
-    ]) or schema_name.startswith('Base') and 'Table' in schema_name:
-        return 'tables'
-    
+    ('tables', _contains_any('_log', 'Table', '_state_log')),
     # Laws - physics laws and dynamics
-    if any(pattern in schema_name for pattern in [
-        'Law', 'Dynamics', 'Collapse', 'Consolidation', 'Decay'
-    ]) or schema_name.startswith('Base') and 'Law' in schema_name:
-        return 'laws'
-    
+    ('laws', _contains_any('Law', 'Dynamics', 'Collapse', 'Consolidation', 'Decay')),
     # Workflows
-    if any(pattern in schema_name for pattern in [
-        'Workflow', 'Ingestion'
-    ]):
-        return 'workflows'
-    
-    # Taxonomy
-    if any(pattern in schema_name for pattern in [
-        'Taxonomy', 'Level', 'Node'
-    ]) and 'Profile' in schema_name:
-        return 'taxonomy'
-    
+    ('workflows', _contains_any('Workflow', 'Ingestion')),
+    # Taxonomy - taxonomy/level/node profiles
+    ('taxonomy', re.compile(r'(?=.*Profile).*(?:Taxonomy|Level|Node)').match),
     # Entity schemas - EXACT matches only for main business objects
-    if schema_name in [
-        'Bond', 'Thread', 'Moment', 'Intent', 'Focus', 'Filament', 
+    ('entities', frozenset({
+        'Bond', 'Thread', 'Moment', 'Intent', 'Focus', 'Filament',
         'Stitch', 'Motif', 'Course', 'Shuttle', 'Tenant', 'PersonThread',
         'GenericThread'
-    ]:
-        return 'entities'
-    
+    }).__contains__),
     # Infrastructure schemas
-    if any(pattern in schema_name for pattern in [
+    ('infrastructure', _contains_any(
         'Service', 'Stack', 'Infrastructure', 'Database', 'Api', 'Workflow',
         'Endpoint'
-    ]) or schema_name.startswith('Base') and any(infra in schema_name for infra in ['Service', 'Api', 'Infrastructure']):
-        return 'infrastructure'
+    )),
+)
+
+# Crate build order (dependencies first)
+CRATE_DEPENDENCY_ORDER = (
+    'types', 'physics', 'common', 'components', 'tables', 'laws', 'workflows',
+    'taxonomy', 'entities', 'infrastructure'
+)
+
+# Crate dependencies
+CRATE_DEPENDENCIES = {
+    'types': [],
+    'physics': ['types'],
+    'common': ['types'],
+    'components': ['types', 'physics'],
+    'tables': ['types', 'common'],
+    'laws': ['types', 'physics'],
+    'workflows': ['types', 'common'],
+    'taxonomy': ['types', 'physics'],
+    'entities': ['types', 'physics', 'components'],
+    'infrastructure': ['types', 'common']
+}
+
+@functools.lru_cache(maxsize=None)
+def categorize_schema(schema_name: str) -> str:
+    """Determine which crate a schema belongs to."""
+    for crate_name, matches in CATEGORY_RULES:
+        if matches(schema_name):
+            return crate_name
     
     # Default to common types
     return 'common'
 
-def generate_rust_code(schema_name: str, cleaned_schema: Dict[str, Any], output_file: Path) -> bool:
-    """Generate Rust code from a cleaned schema."""
+@functools.lru_cache(maxsize=None)
+def typify_command() -> Tuple[str, ...]:
+    """Resolve the cargo-typify binary once per process.
+    
+    Running it directly skips cargo's front-end startup and subcommand lookup
+    on every schema. main checks that it is on PATH before any work starts.
+    """
+    # Cargo subcommands expect their own name as the first argument
+    return (shutil.which("cargo-typify"), "typify")
+
+def typify_cache_salt() -> bytes:
+    """Typify version and argv, mixed into every typify cache key.
+    
+    The generated code depends on the tool as well as the schema, so
+    upgrading cargo-typify or changing how it is invoked starts a fresh cache.
+    """
+    result = subprocess.run(
+        [*typify_command(), "--version"],
+        stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, check=False
+    )
+    return b"\0".join([result.stdout.strip(), *(arg.encode() for arg in (*typify_command(), "-o"))])
+
+def _write_if_changed(path: Path, content) -> bool:
+    """Write ``content`` (str or bytes) unless ``path`` already holds it.
+    
+    Leaving identical files untouched keeps their mtimes, so cargo only
+    rebuilds crates whose sources actually changed. Returns True if written.
+    """
+    data = content.encode('utf-8') if isinstance(content, str) else content
+    try:
+        if path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+    path.write_bytes(data)
+    return True
+
+def generate_rust_code(schema_name: str, cleaned_schema: Dict[str, Any], output_file: Path,
+                       scratch_dir: Path, cache_dir: Path = None, cache_salt: bytes = b"") -> bool:
+    """Generate Rust code from a cleaned schema.
+    
+    The schema is handed to typify as ``<scratch_dir>/<schema_name>.json``
+    and typify writes next to it; the caller owns (and removes) the scratch
+    directory. ``output_file`` is only rewritten when its content changes.
+    
+    With a ``cache_dir``, typify output is cached under the hash of
+    ``cache_salt`` (see typify_cache_salt) and the exact schema bytes fed to
+    typify, and unchanged schemas are copied from the cache instead of
+    re-running ``cargo typify``.
+    """
     print(f"  ⚡ Generating {output_file.name}...")
     
     # Ensure parent directory exists
     output_file.parent.mkdir(parents=True, exist_ok=True)
     
-    # Create temporary file with cleaned schema
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-        json.dump(cleaned_schema, f, indent=2)
-        temp_schema_path = f.name
+    schema_bytes = json_dumps(cleaned_schema)
+    cache_file = None
+    if cache_dir is not None:
+        # Key order affects the generated code, so hash the bytes unsorted
+        digest = hashlib.blake2b(cache_salt, digest_size=16)
+        digest.update(b"\0")
+        digest.update(schema_bytes)
+        cache_key = digest.hexdigest()
+        cache_file = cache_dir / f"{cache_key}.rs"
+        if cache_file.exists():
+            _write_if_changed(output_file, cache_file.read_bytes())
+            return True
+    
+    # Write the cleaned schema where typify can read it
+    schema_path = scratch_dir / f"{schema_name}.json"
+    schema_path.write_bytes(schema_bytes)
+    typified_file = scratch_dir / f"{schema_name}.rs"
     
     try:
-        subprocess.run(
-            ["cargo", "typify", "-o", str(output_file), temp_schema_path],
-            capture_output=True, text=True, check=True
+        # Only stderr is needed (for failures); typify writes its output to -o
+        result = subprocess.run(
+            [*typify_command(), "-o", str(typified_file), str(schema_path)],
+            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, check=False
         )
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"    ❌ Typify failed for {schema_name}: {e.stderr}")
-        return False
+        if result.returncode != 0:
+            print(f"    ❌ Typify failed for {schema_name}: {result.stderr}")
+            return False
     except FileNotFoundError:
-        print("    ❌ cargo typify not found. Install with: cargo install cargo-typify")
-        sys.exit(1)
-    finally:
-        os.unlink(temp_schema_path)
+        # main checks for cargo-typify up front; this only trips if it vanished mid-run
+        print(f"    ❌ cargo typify not found while generating {schema_name}")
+        return False
+    
+    _write_if_changed(output_file, typified_file.read_bytes())
+    if cache_file is not None:
+        save_typify_cache(typified_file, cache_file)
+    return True
+
+def save_typify_cache(rust_file: Path, cache_file: Path) -> None:
+    """Store generated code in the typify cache (best effort, atomic rename)."""
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        temp_cache_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        shutil.copyfile(rust_file, temp_cache_file)
+        os.replace(temp_cache_file, cache_file)
+    except OSError as e:
+        print(f"    ⚠️  Could not write typify cache {cache_file}: {e}")
+
+def process_schema(schema_name: str, schema_file: Path, rust_file: Path,
+                   scratch_dir: Path, cache_dir: Path = None, cache_salt: bytes = b"") -> bool:
+    """Load, clean and typify one schema (worker entry point)."""
+    print(f"🔧 Processing {schema_name}")
+    
+    try:
+        # Load and clean schema; the freshly loaded dict is cleaned in place
+        cleaned_schema = clean_schema_for_typify(json_loads(schema_file.read_bytes()))
+        
+        # Generate Rust code
+        return generate_rust_code(schema_name, cleaned_schema, rust_file, scratch_dir, cache_dir, cache_salt)
+    except Exception as e:
+        print(f"⚠️  Error processing {schema_name}: {e}")
+        return False
 
 def create_crate(crate_dir: Path, crate_name: str, dependencies: List[str], modules: List[str]):
     """Create a Rust crate with proper Cargo.toml and lib.rs."""
@@ -168,38 +285,47 @@ def create_crate(crate_dir: Path, crate_name: str, dependencies: List[str], modu
     src_dir.mkdir(parents=True, exist_ok=True)
 
     # Create Cargo.toml
-    deps_section = "\n".join([
+    deps_lines = [
         'serde = { version = "1.0", features = ["derive"] }',
         'serde_json = "1.0"',
         'chrono = { version = "0.4", features = ["serde"] }',
         'uuid = { version = "1.0", features = ["serde", "v4"] }',
         'indexmap = { version = "2.0", features = ["serde"] }'
-    ])
+    ]
     
     # Add dependencies on other familiar crates
-    for dep in dependencies:
-        deps_section += f'\nfamiliar_{dep} = {{ path = "../{dep}" }}'
+    deps_lines.extend(f'familiar_{dep} = {{ path = "../{dep}" }}' for dep in dependencies)
     
-    cargo_toml = f"""[package]
-name = "familiar_{crate_name}"
-version = "0.1.0"
-edition = "2021"
-description = "Generated Rust types for the '{crate_name}' category."
-
-[dependencies]
-{deps_section}
-"""
+    cargo_toml = "\n".join([
+        '[package]',
+        f'name = "familiar_{crate_name}"',
+        'version = "0.1.0"',
+        'edition = "2021"',
+        f"description = \"Generated Rust types for the '{crate_name}' category.\"",
+        '',
+        '[dependencies]',
+        *deps_lines,
+        ''
+    ])
     
-    (crate_dir / "Cargo.toml").write_text(cargo_toml)
+    _write_if_changed(crate_dir / "Cargo.toml", cargo_toml)
 
     # Create lib.rs with module declarations
     lib_content = [f"//! Generated Rust types for the '{crate_name}' category.\n"]
-    for module in sorted(modules):
-        lib_content.append(f"pub mod {module};")
+    lib_content.extend(f"pub mod {module};" for module in sorted(modules))
     
-    (src_dir / "lib.rs").write_text("\n".join(lib_content))
+    _write_if_changed(src_dir / "lib.rs", "\n".join(lib_content))
     print(f"    📦 Created crate 'familiar_{crate_name}' with {len(modules)} modules")
 
+def prune_stale_modules(crate_dir: Path, modules: List[str]) -> None:
+    """Remove generated .rs files left over from schemas that are gone or failed."""
+    keep = {f"{module}.rs" for module in modules}
+    keep.add("lib.rs")
+    with os.scandir(crate_dir / "src") as entries:
+        for entry in entries:
+            if entry.name.endswith(".rs") and entry.name not in keep:
+                os.unlink(entry.path)
+
 def main():
     """Main execution function."""
     print("🦀 Multi-Crate Rust Generation Pipeline")
@@ -208,14 +334,25 @@ def main():
     script_dir = Path(__file__).parent
     assembled_dir = script_dir.parent / "schemas" / "assembled"
     output_dir = script_dir.parent.parent.parent / "src" / "familiar_schemas" / "generated" / "rust"
+    # Lives outside output_dir so it survives a manual wipe of the workspace
+    typify_cache_dir = script_dir.parent / "schemas" / ".cache" / "typify"
 
     print(f"📁 Assembled schemas: {assembled_dir}")
     print(f"📁 Output workspace: {output_dir}")
 
-    # Clean setup
-    if output_dir.exists():
-        shutil.rmtree(output_dir)
-    output_dir.mkdir(parents=True)
+    # Fail once, before any work is queued, rather than once per schema in the workers
+    if shutil.which("cargo-typify") is None:
+        print("❌ cargo typify not found. Install with: cargo install cargo-typify")
+        return 1
+    typify_salt = typify_cache_salt()
+
+    # Update the workspace in place (stale outputs are pruned at the end) so
+    # unchanged files keep their mtimes and cargo builds stay incremental
+    output_dir.mkdir(parents=True, exist_ok=True)
+    # Typify inputs/outputs; schema names are unique, so workers never collide here
+    scratch_dir = output_dir / ".scratch"
+    shutil.rmtree(scratch_dir, ignore_errors=True)
+    scratch_dir.mkdir()
 
     # Find all assembled schemas
     all_schemas = list(assembled_dir.glob("*.schema.json"))
@@ -238,66 +375,58 @@ def main():
     for crate_name, schemas in crate_schemas.items():
         print(f"   📦 {crate_name}: {len(schemas)} schemas")
 
-    # Define dependency order (dependencies first)
-    dependency_order = ['types', 'physics', 'common', 'components', 'tables', 'laws', 'workflows', 'taxonomy', 'entities', 'infrastructure']
-    
-    # Define crate dependencies
-    crate_deps = {
-        'types': [],
-        'physics': ['types'],
-        'common': ['types'],
-        'components': ['types', 'physics'],
-        'tables': ['types', 'common'],
-        'laws': ['types', 'physics'],
-        'workflows': ['types', 'common'],
-        'taxonomy': ['types', 'physics'],
-        'entities': ['types', 'physics', 'components'],
-        'infrastructure': ['types', 'common']
-    }
-
     successful_files = 0
     failed_files = 0
 
-    # Process crates in dependency order
-    for crate_name in dependency_order:
-        if crate_name not in crate_schemas:
-            continue
-            
-        print(f"\n🏗️  Processing crate: {crate_name}")
-        crate_dir = output_dir / crate_name
-        src_dir = crate_dir / "src"
-        
-        modules = []
-        
-        for schema_name, schema_file in crate_schemas[crate_name]:
-            print(f"🔧 Processing {schema_name}")
+    # Schemas are independent, so typify them all in parallel. Each worker
+    # spawns `cargo typify`, so only use half the cores to avoid oversubscription.
+    max_workers = max(1, (os.cpu_count() or 2) // 2)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        crate_futures = {
+            crate_name: [
+                (schema_name, executor.submit(
+                    process_schema, schema_name, schema_file,
+                    output_dir / crate_name / "src" / f"{schema_name.lower()}.rs",
+                    scratch_dir, typify_cache_dir, typify_salt
+                ))
+                for schema_name, schema_file in crate_schemas[crate_name]
+            ]
+            for crate_name in CRATE_DEPENDENCY_ORDER
+            if crate_name in crate_schemas
+        }
+
+        # Collect results and create crates serially, in dependency order
+        for crate_name, futures in crate_futures.items():
+            print(f"\n🏗️  Processing crate: {crate_name}")
+            crate_dir = output_dir / crate_name
             
-            try:
-                # Load and clean schema
-                schema_data = json.loads(schema_file.read_text())
-                cleaned_schema = clean_schema_for_typify(schema_data)
-                
-                # Generate Rust code
-                rust_file = src_dir / f"{schema_name.lower()}.rs"
-                if generate_rust_code(schema_name, cleaned_schema, rust_file):
+            modules = []
+            for schema_name, future in futures:
+                if future.result():
                     modules.append(schema_name.lower())
                     successful_files += 1
                 else:
                     failed_files += 1
-                    
-            except Exception as e:
-                print(f"⚠️  Error processing {schema_name}: {e}")
-                failed_files += 1
 
-        # Create crate
-        deps = crate_deps.get(crate_name, [])
-        create_crate(crate_dir, crate_name, deps, modules)
+            # Create crate
+            deps = CRATE_DEPENDENCIES.get(crate_name, [])
+            create_crate(crate_dir, crate_name, deps, modules)
+            prune_stale_modules(crate_dir, modules)
+
+    shutil.rmtree(scratch_dir, ignore_errors=True)
+
+    # Drop crates that no longer have any schemas
+    for crate_name in CRATE_DEPENDENCY_ORDER:
+        if crate_name not in crate_schemas:
+            shutil.rmtree(output_dir / crate_name, ignore_errors=True)
 
     # Create workspace Cargo.toml
-    workspace_members = [f'"{crate}"' for crate in dependency_order if crate in crate_schemas]
+    members_section = ",\n    ".join(
+        f'"{crate}"' for crate in CRATE_DEPENDENCY_ORDER if crate in crate_schemas
+    )
     workspace_toml = f"""[workspace]
 members = [
-    {",\n    ".join(workspace_members)}
+    {members_section}
 ]
 resolver = "2"
 
@@ -309,7 +438,7 @@ uuid = {{ version = "1.0", features = ["serde", "v4"] }}
 indexmap = {{ version = "2.0", features = ["serde"] }}
 """
     
-    (output_dir / "Cargo.toml").write_text(workspace_toml)
+    _write_if_changed(output_dir / "Cargo.toml", workspace_toml)
 
     # Summary
     total_schemas = successful_files + failed_files
@@ -10,25 +10,85 @@ This script:
 5. Updates existing lib.rs files in each category crate (NOT creating src/ structure)
 """
 
+import functools
+import hashlib
 import json
+import os
+import re
 import sys
-import tempfile
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from importlib.metadata import PackageNotFoundError, version
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Tuple
 import subprocess
 
+try:
+    # orjson is a much faster drop-in for load/dump when available
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # ijson streams the model entries without materializing the whole file
+    import ijson
+except ImportError:
+    ijson = None
+
+def json_loads(data):
+    """Parse JSON from bytes or str."""
+    return orjson.loads(data) if orjson else json.loads(data)
+
+def json_dumps(obj) -> bytes:
+    """Serialize to compact UTF-8 JSON bytes."""
+    if orjson:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+# Paths, resolved once at import
+SCRIPT_DIR = Path(__file__).resolve().parent
+ROOT_DIR = SCRIPT_DIR.parent.parent.parent
+TEMPLATE_DIR = ROOT_DIR / "templates" / "rust-entities"
+RUST_OUTPUT_DIR = ROOT_DIR / "src" / "familiar_schemas" / "generated" / "rust"
+# Without the Copier template, structs are emitted directly into their own
+# crates here; RUST_OUTPUT_DIR belongs to the typify pipeline
+DIRECT_RUST_OUTPUT_DIR = ROOT_DIR / "src" / "familiar_schemas" / "generated" / "rust_pydantic"
+PYDANTIC_MODELS_FILE = SCRIPT_DIR.parent / "schemas" / "assembled" / "json_rust" / "all_pydantic_models.json"
+# Gitignored and owned by whoever checked out the repo (same root as the typify cache)
+ENTITY_CACHE_DIR = SCRIPT_DIR.parent / "schemas" / ".cache" / "entities"
+
+# Prepared entity data is cached on disk; bump the version when
+# prepare_entity_data's output changes
+ENTITY_CACHE_VERSION = 1
+
+# to_snake_case patterns, compiled once
+_SNAKE_WORD_BOUNDARY = re.compile(r'(.)([A-Z][a-z]+)')
+_SNAKE_CASE_BOUNDARY = re.compile(r'([a-z0-9])([A-Z])')
+_SNAKE_UNDERSCORE_RUNS = re.compile(r'_+')
+
+RUST_KEYWORDS = frozenset({
+    'as', 'break', 'const', 'continue', 'crate', 'else', 'enum', 'extern',
+    'false', 'fn', 'for', 'if', 'impl', 'in', 'let', 'loop', 'match',
+    'mod', 'move', 'mut', 'pub', 'ref', 'return', 'self', 'Self', 'static',
+    'struct', 'super', 'trait', 'true', 'type', 'unsafe', 'use', 'where',
+    'while', 'async', 'await', 'dyn', 'abstract', 'become', 'box', 'do',
+    'final', 'macro', 'override', 'priv', 'typeof', 'unsized', 'virtual',
+    'yield', 'try'
+})
+
+@functools.lru_cache(maxsize=1)
 def load_pydantic_models() -> Dict[str, Any]:
-    """Load the extracted Pydantic model data."""
-    data_file = Path(__file__).parent.parent / "schemas" / "assembled" / "json_rust" / "all_pydantic_models.json"
+    """Load the extracted Pydantic model data (parsed once, then cached; do not mutate)."""
+    data_file = PYDANTIC_MODELS_FILE
     
     if not data_file.exists():
         print(f"❌ Pydantic model data not found: {data_file}")
         print("   Run extract_pydantic_entities.py first")
         return {}
     
-    with open(data_file, 'r') as f:
-        return json.load(f)
+    return json_loads(data_file.read_bytes())
 
+@functools.lru_cache(maxsize=4096)
 def sanitize_pascal_case(name: str) -> str:
     """Convert name to proper PascalCase without underscores."""
     # Split on underscores and capitalize each part
@@ -43,30 +103,53 @@ def sanitize_pascal_case(name: str) -> str:
     
     return result
 
+@functools.lru_cache(maxsize=4096)
 def escape_rust_keywords(field_name: str) -> str:
     """Escape Rust keywords by adding r# prefix."""
-    rust_keywords = {
-        'as', 'break', 'const', 'continue', 'crate', 'else', 'enum', 'extern',
-        'false', 'fn', 'for', 'if', 'impl', 'in', 'let', 'loop', 'match',
-        'mod', 'move', 'mut', 'pub', 'ref', 'return', 'self', 'Self', 'static',
-        'struct', 'super', 'trait', 'true', 'type', 'unsafe', 'use', 'where',
-        'while', 'async', 'await', 'dyn', 'abstract', 'become', 'box', 'do',
-        'final', 'macro', 'override', 'priv', 'typeof', 'unsized', 'virtual',
-        'yield', 'try'
-    }
-    
-    if field_name in rust_keywords:
+    if field_name in RUST_KEYWORDS:
         return f"r#{field_name}"
     return field_name
 
-def prepare_entity_data(models: Dict[str, Any], category: str) -> List[Dict[str, Any]]:
-    """Prepare entity data for Rust generation."""
+def index_models_by_category(model_items) -> Dict[str, List[Tuple[str, Dict[str, Any]]]]:
+    """Bucket an iterable of (model_name, model_data) pairs by category in a single pass."""
+    by_category = defaultdict(list)
+    for model_name, model_data in model_items:
+        by_category[model_data.get("category")].append((model_name, model_data))
+    return by_category
+
+def load_models_by_category():
+    """Return (model_count, category index) for the extracted models, or None if unavailable.
+    
+    With ijson installed, the "models" mapping is streamed straight into the
+    index so the rest of the document (schemas, validation) is never built in
+    memory; otherwise the whole file is parsed.
+    """
+    if ijson is None or not PYDANTIC_MODELS_FILE.exists():
+        data = load_pydantic_models()
+        if not data:
+            return None
+        models = data.get("models", {})
+        return len(models), index_models_by_category(models.items())
+    
+    with open(PYDANTIC_MODELS_FILE, 'rb') as f:
+        by_category = index_models_by_category(ijson.kvitems(f, "models", use_float=True))
+    return sum(map(len, by_category.values())), by_category
+
+# Field-name fragments that mark a field as physics-related
+PHYSICS_KEYWORDS = ("energy", "tension", "decay", "normalized", "factor", "physics")
+_PHYSICS_KEYWORD_RE = re.compile("|".join(PHYSICS_KEYWORDS))
+
+@functools.lru_cache(maxsize=4096)
+def is_physics_field(field_name: str) -> bool:
+    """Whether a field name looks physics-related (memoized; names repeat across models)."""
+    # One alternation scan instead of a substring test per keyword
+    return _PHYSICS_KEYWORD_RE.search(field_name.lower()) is not None
+
+def prepare_entity_data(category_models: List[Tuple[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """Prepare entity data for Rust generation from one category's models."""
     entities = []
     
-    for model_name, model_data in models.items():
-        if model_data.get("category") != category:
-            continue
-        
+    for model_name, model_data in category_models:
         # Sanitize the model name to proper PascalCase
         clean_name = sanitize_pascal_case(model_name)
         
@@ -75,9 +158,7 @@ def prepare_entity_data(models: Dict[str, Any], category: str) -> List[Dict[str,
         has_physics_fields = False
         
         for field in model_data.get("fields", []):
-            is_physics_field = any(keyword in field["name"].lower() 
-                                 for keyword in ["energy", "tension", "decay", "normalized", "factor", "physics"])
-            if is_physics_field:
+            if is_physics_field(field["name"]):
                 has_physics_fields = True
                 
             # Escape Rust keywords in field names
@@ -103,98 +184,263 @@ def prepare_entity_data(models: Dict[str, Any], category: str) -> List[Dict[str,
     
     return entities
 
+# Categories reported in the model summary
+MODEL_CATEGORIES = ("entities", "components", "snippets", "laws", "tables", "taxonomy", "workflows")
+
+# Common Python -> Rust type mappings
+RUST_TYPE_MAP = {
+    "str": "String",
+    "int": "i64", 
+    "float": "f64",
+    "bool": "bool",
+    "typing.Union": "Option",
+    "typing.Optional": "Option",
+    "typing.List": "Vec",
+    "typing.Dict": "HashMap",
+    "datetime.datetime": "chrono::DateTime<chrono::Utc>",
+    "uuid.UUID": "uuid::Uuid"
+}
+
+# Generic constructors convert_to_rust_type maps, and the text inside the
+# first "[" of a type string (stopping at any nested "[")
+_GENERIC_HEAD = re.compile(r"(List|Vec|Union)\[")
+_FIRST_TYPE_ARGS = re.compile(r"\[([^\[]*)")
+
 def convert_to_rust_type(python_type: str, field_name: str = "") -> str:
     """Convert Python type to Rust type."""
-    # Handle common type mappings
-    type_map = {
-        "str": "String",
-        "int": "i64", 
-        "float": "f64",
-        "bool": "bool",
-        "typing.Union": "Option",
-        "typing.Optional": "Option",
-        "typing.List": "Vec",
-        "typing.Dict": "HashMap",
-        "datetime.datetime": "chrono::DateTime<chrono::Utc>",
-        "uuid.UUID": "uuid::Uuid"
-    }
+    # Handle special physics fields: normalized values are always f64
+    field_name = field_name.lower()
+    return _convert_to_rust_type_cached(python_type, "normalized" in field_name or "factor" in field_name)
+
+@functools.lru_cache(maxsize=None)
+def _convert_to_rust_type_cached(python_type: str, normalized: bool) -> str:
+    """Memoized body of convert_to_rust_type; only distinct type strings are parsed."""
+    if normalized:
+        return "f64"
     
     # Clean up the type string
     clean_type = python_type.replace("<class '", "").replace("'>", "").replace("typing.", "")
     
-    # Handle special physics fields
-    if "normalized" in field_name.lower() or "factor" in field_name.lower():
-        return "f64"  # Normalized values are always f64
-    
-    # Handle Vec/List types
-    if "List[" in clean_type or "Vec[" in clean_type:
-        inner_type = clean_type.split("[")[1].rstrip("]")
-        inner_rust = convert_to_rust_type(inner_type)
-        return f"Vec<{inner_rust}>"
-    
-    # Handle Optional types
-    if "Union[" in clean_type and "NoneType" in clean_type:
-        # Extract the non-None type
-        types = clean_type.split("[")[1].rstrip("]").split(", ")
-        non_none_types = [t for t in types if "NoneType" not in t]
-        if non_none_types:
-            inner_rust = convert_to_rust_type(non_none_types[0])
-            return f"Option<{inner_rust}>"
+    # One regex pass finds which generic constructors appear at all
+    generics = _GENERIC_HEAD.findall(clean_type)
+    if generics:
+        # Arguments of the first bracket (up to any nested bracket)
+        type_args = _FIRST_TYPE_ARGS.search(clean_type).group(1).rstrip("]")
+        
+        # Handle Vec/List types
+        if "List" in generics or "Vec" in generics:
+            return f"Vec<{_convert_to_rust_type_cached(type_args, False)}>"
+        
+        # Handle Optional types: extract the non-None type
+        if "NoneType" in clean_type:
+            for inner_type in type_args.split(", "):
+                if "NoneType" not in inner_type:
+                    return f"Option<{_convert_to_rust_type_cached(inner_type, False)}>"
     
-    return type_map.get(clean_type, "String")  # Default to String
+    return RUST_TYPE_MAP.get(clean_type, "String")  # Default to String
 
+@functools.lru_cache(maxsize=4096)
 def to_snake_case(name: str) -> str:
     """Convert PascalCase to snake_case."""
-    import re
     # Handle special cases first
     if name.lower() == name:  # Already lowercase
         return name.lower()
     
     # Insert underscores before uppercase letters
-    s1 = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', name)
-    s2 = re.sub('([a-z0-9])([A-Z])', r'\1_\2', s1)
+    s1 = _SNAKE_WORD_BOUNDARY.sub(r'\1_\2', name)
+    s2 = _SNAKE_CASE_BOUNDARY.sub(r'\1_\2', s1)
     
     # Clean up any double underscores and convert to lowercase
-    result = re.sub('_+', '_', s2).lower()
+    result = _SNAKE_UNDERSCORE_RUNS.sub('_', s2).lower()
     
     # Remove leading/trailing underscores
     return result.strip('_')
 
-def install_jinja2_jsonschema():
-    """Install jinja2-jsonschema if not available."""
+def is_installed(distribution: str) -> bool:
+    """Check for an installed distribution via its metadata, without importing it."""
     try:
-        import jinja2_jsonschema
+        version(distribution)
+        return True
+    except PackageNotFoundError:
+        return False
+
+def pip_install(package: str) -> None:
+    """pip-install a package non-interactively, reusing the persistent pip cache."""
+    env = dict(os.environ)
+    env.setdefault("PIP_CACHE_DIR", str(Path.home() / ".cache" / "pip"))
+    subprocess.run(
+        [sys.executable, "-m", "pip", "install", "--disable-pip-version-check", "--no-input", package],
+        env=env, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE
+    )
+
+@functools.lru_cache(maxsize=1)
+def install_jinja2_jsonschema():
+    """Install jinja2-jsonschema if not available (probed once per process)."""
+    if is_installed("jinja2-jsonschema"):
         print("    ✅ jinja2-jsonschema already available")
         return True
-    except ImportError:
-        print("    📦 Installing jinja2-jsonschema...")
-        try:
-            subprocess.run([sys.executable, "-m", "pip", "install", "jinja2-jsonschema"], 
-                         check=True, capture_output=True)
-            print("    ✅ jinja2-jsonschema installed successfully")
-            return True
-        except subprocess.CalledProcessError as e:
-            print(f"    ❌ Failed to install jinja2-jsonschema: {e}")
-            return False
+    
+    print("    📦 Installing jinja2-jsonschema...")
+    try:
+        pip_install("jinja2-jsonschema")
+        print("    ✅ jinja2-jsonschema installed successfully")
+        return True
+    except subprocess.CalledProcessError as e:
+        print(f"    ❌ Failed to install jinja2-jsonschema: {e}")
+        return False
+
+# Copier answers shared by every category crate
+BASE_COPIER_ANSWERS = {
+    "include_physics_validation": True,
+    "include_ecs_components": True,
+    "include_serde_support": True,
+    "include_builder_patterns": False,   # Disabled to avoid compilation issues
+    "generate_contract_tests": True,
+    "enable_schema_validation": True,    # Enable schema validation with jinja2-jsonschema
+    "pydantic_source_dir": "../src/familiar_schemas/familiar_schemas/entities",
+    "json_schema_dir": "../docs/v3/schemas/assembled/json"
+}
+
+@functools.lru_cache(maxsize=1)
+def jinja_bytecode_cache():
+    """On-disk cache of compiled template bytecode shared by every Copier run.
+    
+    Copier builds a fresh Jinja environment per run, so without this each
+    category (and each invocation) recompiles every template from source.
+    With no directory given, Jinja uses a private per-user directory (mode
+    0700, ownership checked), so other users cannot plant bytecode in it.
+    """
+    from jinja2 import FileSystemBytecodeCache
+    
+    return FileSystemBytecodeCache()
+
+def emit_entity_struct(entity: Dict[str, Any]) -> str:
+    """Render one entity as a serde-derived Rust struct module (no Jinja involved)."""
+    lines = [
+        f"//! Generated from Pydantic model `{entity['pydantic_class']}`.",
+        "",
+        "use serde::{Deserialize, Serialize};",
+    ]
+    if any("HashMap" in field["rust_type"] for field in entity["fields"]):
+        lines.append("use std::collections::HashMap;")
+    lines += [
+        "",
+        "#[derive(Debug, Clone, Serialize, Deserialize)]",
+        f"pub struct {entity['name']} {{",
+    ]
+    for field in entity["fields"]:
+        if field["description"]:
+            lines.extend(f"    /// {line}".rstrip() for line in field["description"].splitlines())
+        rust_type = field["rust_type"]
+        if not field["required"]:
+            lines.append("    #[serde(default)]")
+            if not rust_type.startswith("Option<"):
+                rust_type = f"Option<{rust_type}>"
+        lines.append(f"    pub {field['name']}: {rust_type},")
+    lines.append("}")
+    lines.append("")
+    return "\n".join(lines)
+
+def generate_rust_direct(entities: List[Dict[str, Any]], category: str, category_output_dir: Path) -> bool:
+    """Write one module per entity plus lib.rs straight from Python.
+    
+    The output shape is fixed (a derive + pub fields per struct), so this skips
+    the Jinja parse/compile/render loop entirely. Used when the Copier template
+    is unavailable; the caller points it at DIRECT_RUST_OUTPUT_DIR so it never
+    touches the typify crates.
+    """
+    src_dir = category_output_dir / "src"
+    src_dir.mkdir(parents=True, exist_ok=True)
+    
+    lib_lines = [f"//! Generated Rust types for the '{category}' category.", ""]
+    for entity in sorted(entities, key=lambda entity: entity["snake_name"]):
+        (src_dir / f"{entity['snake_name']}.rs").write_text(emit_entity_struct(entity))
+        # `mod r#type;` still resolves to type.rs
+        module = escape_rust_keywords(entity["snake_name"])
+        lib_lines.append(f"pub mod {module};")
+        lib_lines.append(f"pub use {module}::{entity['name']};")
+    lib_lines.append("")
+    (src_dir / "lib.rs").write_text("\n".join(lib_lines))
+    
+    (category_output_dir / "Cargo.toml").write_text("\n".join([
+        "[package]",
+        f'name = "familiar_pydantic_{category}"',
+        'version = "0.1.0"',
+        'edition = "2021"',
+        "",
+        "[dependencies]",
+        'serde = { version = "1.0", features = ["derive"] }',
+        'serde_json = "1.0"',
+        'chrono = { version = "0.4", features = ["serde"] }',
+        'uuid = { version = "1.0", features = ["serde", "v4"] }',
+        "",
+        "# Standalone: keeps cargo from attaching it to the repo's root workspace",
+        "[workspace]",
+        ""
+    ]))
+    
+    print(f"    ✅ Emitted {len(entities)} structs for {category}")
+    return True
+
+@functools.lru_cache(maxsize=1)
+def models_file_digest() -> str:
+    """SHA-256 of the model data file (and cache version), computed once per run."""
+    digest = hashlib.sha256(f"v{ENTITY_CACHE_VERSION}".encode())
+    # Hash in chunks so a large models file is never held in memory whole
+    with open(PYDANTIC_MODELS_FILE, 'rb') as f:
+        for chunk in iter(functools.partial(f.read, 1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def load_cached_entity_data(category: str, category_models: List[Tuple[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """prepare_entity_data, cached on disk under a hash of the model data file.
+    
+    Repeat runs over an unchanged all_pydantic_models.json load the prepared
+    entities instead of converting every field again.
+    """
+    cache_file = ENTITY_CACHE_DIR / f"{category}_{models_file_digest()}.json"
+    
+    try:
+        return json_loads(cache_file.read_bytes())
+    except (OSError, ValueError):
+        pass
+    
+    entities = prepare_entity_data(category_models)
+    try:
+        ENTITY_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        temp_cache_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        temp_cache_file.write_bytes(json_dumps(entities))
+        os.replace(temp_cache_file, cache_file)
+        
+        # Entries for older versions of the models file can never hit again
+        for stale_file in ENTITY_CACHE_DIR.glob(f"{category}_{'?' * 64}.json"):
+            if stale_file != cache_file:
+                stale_file.unlink(missing_ok=True)
+    except OSError as e:
+        print(f"    ⚠️  Could not write entity cache {cache_file}: {e}")
+    return entities
 
 def generate_rust_with_copier(entities: List[Dict[str, Any]], category: str, base_output_dir: Path) -> bool:
-    """Generate Rust code using existing category crate structure."""
+    """Generate Rust code using existing category crate structure.
     
-    # Ensure jinja2-jsonschema is available
-    if not install_jinja2_jsonschema():
-        print(f"    ⚠️  Proceeding without schema validation")
+    Without the Copier template, base_output_dir should be
+    DIRECT_RUST_OUTPUT_DIR and the structs are emitted directly.
+    """
     
     # Set up paths - use existing category crate structure
-    script_dir = Path(__file__).parent
-    root_dir = script_dir.parent.parent.parent
-    template_dir = root_dir / "templates" / "rust-entities"
+    template_dir = TEMPLATE_DIR
     
     # Target the existing category crate directory
     category_output_dir = base_output_dir / category
     
     if not template_dir.exists():
-        print(f"    ❌ Template directory not found: {template_dir}")
-        return False
+        print(f"    ⚠️  Template directory not found: {template_dir}")
+        print(f"    🔧 Emitting plain serde structs for {category} directly")
+        return generate_rust_direct(entities, category, category_output_dir)
+    
+    # Ensure jinja2-jsonschema is available
+    if not install_jinja2_jsonschema():
+        print(f"    ⚠️  Proceeding without schema validation")
     
     if not category_output_dir.exists():
         print(f"    ⚠️  Category directory doesn't exist: {category_output_dir}")
@@ -213,18 +459,13 @@ def generate_rust_with_copier(entities: List[Dict[str, Any]], category: str, bas
             "service_name": f"familiar-{category}",
             "project_name": f"familiar_{category}",
             "entities": entities,
-            "include_physics_validation": True,
-            "include_ecs_components": True,
-            "include_serde_support": True,
-            "include_builder_patterns": False,   # Disabled to avoid compilation issues
-            "generate_contract_tests": True,
-            "enable_schema_validation": True,    # Enable schema validation with jinja2-jsonschema
-            "pydantic_source_dir": "../src/familiar_schemas/familiar_schemas/entities",
-            "json_schema_dir": "../docs/v3/schemas/assembled/json"
+            **BASE_COPIER_ANSWERS
         }
         
-        # Generate the category crate using Copier
-        copier.run_copy(
+        # Generate the category crate using Copier. Same arguments as
+        # copier.run_copy, but going through the Worker lets us hand its Jinja
+        # environment the shared bytecode cache before anything is rendered.
+        with copier.Worker(
             src_path=str(template_dir),
             dst_path=str(category_output_dir),
             data=answers,
@@ -232,16 +473,20 @@ def generate_rust_with_copier(entities: List[Dict[str, Any]], category: str, bas
             overwrite=True,
             unsafe=True,  # Allow overwriting
             vcs_ref=None
-        )
+        ) as worker:
+            worker.jinja_env.bytecode_cache = jinja_bytecode_cache()
+            worker.run_copy()
         
         print(f"    ✅ Copier generation completed for {category}")
         
         # Format generated Rust code with cargo fmt if Cargo.toml exists
         cargo_toml = category_output_dir / "Cargo.toml"
         if cargo_toml.exists():
+            # Copier rewrites the sources unformatted on every run, so always format
             print(f"    🎨 Formatting Rust code with cargo fmt...")
             try:
-                subprocess.run(['cargo', 'fmt'], cwd=str(category_output_dir), check=True, capture_output=True)
+                subprocess.run(['cargo', 'fmt'], cwd=str(category_output_dir), check=True,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
                 print(f"    ✅ Rust code formatted successfully")
             except (subprocess.CalledProcessError, FileNotFoundError) as e:
                 print(f"    ⚠️  cargo fmt not available or failed: {e}")
@@ -251,8 +496,7 @@ def generate_rust_with_copier(entities: List[Dict[str, Any]], category: str, bas
     except ImportError:
         print(f"    ❌ Copier not installed. Installing...")
         try:
-            subprocess.run([sys.executable, "-m", "pip", "install", "copier"], 
-                         check=True, capture_output=True)
+            pip_install("copier")
             print(f"    ✅ Copier installed. Please run the script again.")
             return False
         except subprocess.CalledProcessError as e:
@@ -268,26 +512,25 @@ def main():
     
     # Load Pydantic model data
     print("📂 Loading Pydantic model data...")
-    data = load_pydantic_models()
+    loaded = load_models_by_category()
     
-    if not data:
+    if loaded is None:
         return 1
     
-    models = data.get("models", {})
+    model_count, by_category = loaded
     
-    # Count actual models per category
-    actual_counts = {}
-    for category in ["entities", "components", "snippets", "laws", "tables", "taxonomy", "workflows"]:
-        actual_counts[category] = len([name for name, model_data in models.items() 
-                                     if model_data.get("category") == category])
+    # Count actual models per category; the index is already bucketed, so
+    # this is one len() per category rather than another scan of the models
+    actual_counts = {category: len(by_category.get(category, ())) for category in MODEL_CATEGORIES}
     
-    print(f"   ✅ Loaded {len(models)} models")
+    print(f"   ✅ Loaded {model_count} models")
     print(f"   📊 Actual categories: {actual_counts}")
     
-    # Set up output directory - use existing structure
-    script_dir = Path(__file__).parent
-    root_dir = script_dir.parent.parent.parent
-    base_output_dir = root_dir / "src" / "familiar_schemas" / "generated" / "rust"
+    # Set up output directory - use existing structure, unless there is no
+    # Copier template and the structs are emitted into their own crates
+    use_copier = TEMPLATE_DIR.exists()
+    base_output_dir = RUST_OUTPUT_DIR if use_copier else DIRECT_RUST_OUTPUT_DIR
+    schema_validation = False
     
     print(f"\n🏗️  Updating Rust crates in: {base_output_dir}")
     
@@ -295,6 +538,7 @@ def main():
     categories_to_generate = ["entities"]  # Only entities need API endpoints
     total_generated = 0
     
+    tasks = []
     for category in categories_to_generate:
         category_count = actual_counts.get(category, 0)
         if category_count == 0:
@@ -304,18 +548,36 @@ def main():
         print(f"\n  🦀 Updating {category} crate ({category_count} models)...")
         
         # Prepare entity data for this category
-        entities = prepare_entity_data(models, category)
+        entities = load_cached_entity_data(category, by_category.get(category, []))
         
         if not entities:
             print(f"    ⚠️  No entities found for {category}")
             continue
         
-        # Generate Rust code using Copier
-        if generate_rust_with_copier(entities, category, base_output_dir):
-            total_generated += len(entities)
-            print(f"    📊 {category}: {len(entities)} structs generated")
-        else:
-            print(f"    ❌ Failed to generate {category}")
+        tasks.append((category, entities))
+    
+    if tasks:
+        # Probe (and if needed install) jinja2-jsonschema once up front rather
+        # than racing pip installs from several workers; only Copier uses it
+        if use_copier:
+            schema_validation = install_jinja2_jsonschema()
+        
+        # Categories write to separate crates, so Copier + cargo fmt can run
+        # for all of them at once; map() keeps results in category order
+        with ProcessPoolExecutor(max_workers=min(len(tasks), os.cpu_count() or 1)) as executor:
+            results = list(executor.map(
+                generate_rust_with_copier,
+                [entities for _, entities in tasks],
+                [category for category, _ in tasks],
+                [base_output_dir] * len(tasks)
+            ))
+        
+        for (category, entities), generated in zip(tasks, results):
+            if generated:
+                total_generated += len(entities)
+                print(f"    📊 {category}: {len(entities)} structs generated")
+            else:
+                print(f"    ❌ Failed to generate {category}")
     
     print(f"\n🎯 Generation Summary:")
     print(f"   ✅ Total structs generated: {total_generated}")
@@ -334,10 +596,14 @@ def main():
             print(f"   🌐 {category}: {doc_url}")
     
     print(f"\n🔍 Features enabled:")
-    print(f"   ✅ Copier template pipeline")
-    print(f"   ✅ jinja2-jsonschema validation")
-    print(f"   ✅ cargo fmt formatting")
-    print(f"   ✅ Existing crate structure preserved")
+    if use_copier:
+        print(f"   ✅ Copier template pipeline")
+        if schema_validation:
+            print(f"   ✅ jinja2-jsonschema validation")
+        print(f"   ✅ cargo fmt formatting (where cargo is available)")
+        print(f"   ✅ Existing crate structure preserved")
+    else:
+        print(f"   ✅ Direct serde struct emission (Copier template not found)")
     print(f"   ✅ Rust keyword escaping")
 
 if __name__ == "__main__":
@@ -0,0 +1,87 @@
+#!/usr/bin/env node
+/**
+ * Persistent quicktype worker for recursive_schema_build.py
+ *
+ * Loads quicktype-core once, then answers requests from stdin until it is
+ * closed. Every message in either direction is one frame: a 4-byte
+ * little-endian length followed by that many bytes of UTF-8 JSON.
+ *
+ *   startup:  {"ready": true} or {"ready": false, "error": "..."}
+ *   request:  {"sources": [{"name": "...", "schema": "<JSON text>"}], "options": {...}}
+ *   response: {"ok": true, "rust": "..."} or {"ok": false, "error": "..."}
+ *
+ * "options" are quicktype Rust renderer options, e.g. {"density": "dense"}.
+ */
+
+import { createRequire } from "node:module";
+import path from "node:path";
+
+const require = createRequire(import.meta.url);
+
+function loadQuicktypeCore() {
+  // quicktype-core usually only exists inside a global `npm install -g quicktype`
+  const globalRoot = path.join(path.dirname(path.dirname(process.execPath)), "lib", "node_modules");
+  const candidates = [
+    "quicktype-core",
+    path.join(globalRoot, "quicktype-core"),
+    path.join(globalRoot, "quicktype", "node_modules", "quicktype-core"),
+  ];
+  for (const candidate of candidates) {
+    try {
+      return require(candidate);
+    } catch {
+      // Try the next location
+    }
+  }
+  return null;
+}
+
+function writeFrame(message) {
+  const body = Buffer.from(JSON.stringify(message), "utf8");
+  const header = Buffer.alloc(4);
+  header.writeUInt32LE(body.length, 0);
+  process.stdout.write(Buffer.concat([header, body]));
+}
+
+async function* readFrames(stream) {
+  let buffered = Buffer.alloc(0);
+  for await (const chunk of stream) {
+    buffered = Buffer.concat([buffered, chunk]);
+    while (buffered.length >= 4) {
+      const length = buffered.readUInt32LE(0);
+      if (buffered.length < 4 + length) {
+        break;
+      }
+      yield JSON.parse(buffered.subarray(4, 4 + length).toString("utf8"));
+      buffered = buffered.subarray(4 + length);
+    }
+  }
+}
+
+async function render(core, { sources, options }) {
+  const schemaInput = new core.JSONSchemaInput(new core.FetchingJSONSchemaStore());
+  for (const { name, schema } of sources) {
+    await schemaInput.addSource({ name, schema });
+  }
+
+  const inputData = new core.InputData();
+  inputData.addInput(schemaInput);
+
+  const result = await core.quicktype({ inputData, lang: "rust", rendererOptions: options });
+  return result.lines.join("\n") + "\n";
+}
+
+const core = loadQuicktypeCore();
+if (!core) {
+  writeFrame({ ready: false, error: "quicktype-core not found - install with: npm install -g quicktype" });
+  process.exit(1);
+}
+
+writeFrame({ ready: true });
+for await (const request of readFrames(process.stdin)) {
+  try {
+    writeFrame({ ok: true, rust: await render(core, request) });
+  } catch (e) {
+    writeFrame({ ok: false, error: String((e && e.message) || e) });
+  }
+}
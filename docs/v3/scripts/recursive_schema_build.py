@@ -11,25 +11,113 @@ This solves the current 0% entity success rate by:
 3. Using appropriate generation strategy per level
 """
 
+import atexit
+import functools
+import hashlib
 import json
 import os
+import re
+import select
+import time
 import sys
 import subprocess
 import tempfile
 import shutil
 from pathlib import Path
-from typing import Dict, List, Set, Optional, Tuple
+from typing import Dict, FrozenSet, List, Set, Optional, Tuple
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from enum import Enum
 
-@dataclass
+from schema_walker import walk_and_transform
+
+try:
+    # orjson is a much faster drop-in for load/dump when available
+    import orjson
+except ImportError:
+    orjson = None
+
+def json_loads(data):
+    """Parse JSON from bytes or str."""
+    return orjson.loads(data) if orjson else json.loads(data)
+
+def json_dumps_indented(obj) -> bytes:
+    """Serialize to UTF-8 JSON bytes with 2-space indentation."""
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode('utf-8')
+
+# Bump whenever preprocessing or quicktype options change, to invalidate the cache
+PREPROC_VERSION = b"1"
+
+# A "$ref" key and its string value, matched on raw bytes (escapes allowed)
+_REF_RE = re.compile(rb'"\$ref"\s*:\s*"((?:[^"\\]|\\.)*)"')
+
+# Schema file suffixes, most specific first
+SCHEMA_SUFFIXES = ('.event.schema.json', '.table.schema.json', '.schema.json', '.json')
+
+@functools.lru_cache(maxsize=None)
+def schema_name_from_filename(filename: str) -> str:
+    """Strip the schema suffix from a file name"""
+    for suffix in SCHEMA_SUFFIXES:
+        name = filename.removesuffix(suffix)
+        if name != filename:
+            return name
+    return filename
+
+# Rust renderer options shared by the quicktype CLI and the persistent worker
+QUICKTYPE_RUST_OPTIONS = {
+    "derive-debug": "true",
+    "derive-clone": "true",
+    "visibility": "public",
+    "density": "dense",
+}
+
+QUICKTYPE_WORKER_SCRIPT = Path(__file__).resolve().parent / "quicktype_worker.mjs"
+
+# Combined output when a whole level is generated in one quicktype run
+LEVEL_OUTPUT_FILE = "types.rs"
+
+# Familiar extensions that Rust generators reject
+RUST_EXTENSIONS_TO_REMOVE = frozenset({
+    'category', 'source_file', 'schema_version',
+    'physics_properties',
+})
+
+def _fix_enum_const_node(obj: dict, stats: dict):
+    """Fix enum + const conflicts that break Rust generators"""
+    # If both enum and const exist, remove enum (keep const for specificity)
+    if 'enum' in obj and 'const' in obj:
+        del obj['enum']
+        stats['enum_const_fixed'] += 1
+        
+def _fix_constrained_numeric_node(obj: dict, stats: dict):
+    """Transform a constrained numeric to a newtype hint"""
+    # Detect constrained numeric
+    if obj.get('type') == 'number' and ('minimum' in obj or 'maximum' in obj):
+        # Mark for newtype generation
+        obj['x-rust-newtype'] = True
+        obj['x-rust-validation'] = {
+            'min': obj.pop('minimum', None),
+            'max': obj.pop('maximum', None),
+        }
+        stats['newtype_marked'] += 1
+        
+def _clean_for_rust_node(obj: dict):
+    """Remove Rust-incompatible extensions"""
+    for ext in RUST_EXTENSIONS_TO_REMOVE & obj.keys():
+        del obj[ext]
+        
+@dataclass(slots=True, frozen=True)
 class SchemaInfo:
     """Information about a schema file"""
     path: Path
     name: str
     level: int
-    dependencies: Set[str]
+    dependencies: FrozenSet[str]
     category: str
+    rel_path: str  # POSIX path relative to schemas_dir
 
 class BuildLevel(Enum):
     """Schema build levels in dependency order"""
@@ -40,172 +128,389 @@ class BuildLevel(Enum):
     COMPONENTS = 4      # Depend on Levels 0-3
     ENTITIES = 5        # Depend on Levels 0-4
 
+class QuicktypeWorker:
+    """Persistent Node process rendering Rust with quicktype-core
+    
+    Node and quicktype load once instead of once per schema. Requests and
+    responses are length-prefixed JSON frames, see quicktype_worker.mjs.
+    """
+    
+    def __init__(self, proc: subprocess.Popen):
+        self.proc = proc
+        self.owner_pid = os.getpid()
+        
+    @classmethod
+    def start(cls) -> Optional['QuicktypeWorker']:
+        """Launch the worker, returning None when node or quicktype-core is unavailable"""
+        try:
+            proc = subprocess.Popen(
+                ["node", str(QUICKTYPE_WORKER_SCRIPT)],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+        except OSError:
+            return None
+            
+        worker = cls(proc)
+        ready = worker._read_frame(timeout=30)
+        if not ready or not ready.get('ready'):
+            worker.close()
+            return None
+        return worker
+        
+    def _read_exactly(self, size: int, deadline: float) -> Optional[bytes]:
+        """Read size bytes from the worker, or None on EOF or timeout"""
+        fd = self.proc.stdout.fileno()
+        data = b''
+        while len(data) < size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not select.select([fd], [], [], remaining)[0]:
+                return None
+            chunk = os.read(fd, size - len(data))
+            if not chunk:
+                return None
+            data += chunk
+        return data
+        
+    def _read_frame(self, timeout: float) -> Optional[dict]:
+        deadline = time.monotonic() + timeout
+        header = self._read_exactly(4, deadline)
+        if header is None:
+            return None
+        body = self._read_exactly(int.from_bytes(header, 'little'), deadline)
+        return None if body is None else json_loads(body)
+        
+    def render(self, sources: List[Tuple[str, bytes]], options: Dict[str, str],
+               timeout: float) -> Optional[dict]:
+        """Render (name, schema JSON) sources to Rust
+        
+        Returns the worker's {"ok", "rust" | "error"} response, or None if the
+        worker died or timed out, in which case it is shut down.
+        """
+        payload = json.dumps({
+            'sources': [{'name': name, 'schema': schema.decode('utf-8')} for name, schema in sources],
+            'options': options,
+        }).encode('utf-8')
+        try:
+            self.proc.stdin.write(len(payload).to_bytes(4, 'little') + payload)
+            self.proc.stdin.flush()
+        except OSError:
+            self.close()
+            return None
+            
+        response = self._read_frame(timeout)
+        if response is None:
+            self.close()
+        return response
+        
+    def close(self):
+        if self.proc.poll() is None:
+            self.proc.kill()
+        self.proc.wait()
+        
+        
+_quicktype_worker: Optional[QuicktypeWorker] = None
+_quicktype_worker_failed = False
+
+def get_quicktype_worker() -> Optional[QuicktypeWorker]:
+    """This process's quicktype worker, started on first use; None means use the CLI"""
+    global _quicktype_worker, _quicktype_worker_failed
+    
+    # A worker inherited through fork belongs to the parent; never share its pipes
+    if _quicktype_worker is not None and _quicktype_worker.owner_pid != os.getpid():
+        _quicktype_worker = None
+        _quicktype_worker_failed = False
+        
+    if _quicktype_worker is None and not _quicktype_worker_failed:
+        _quicktype_worker = QuicktypeWorker.start()
+        if _quicktype_worker is None:
+            _quicktype_worker_failed = True
+        else:
+            atexit.register(_quicktype_worker.close)
+    return _quicktype_worker
+    
+def render_with_worker(sources: List[Tuple[str, bytes]], options: Dict[str, str],
+                       timeout: float) -> Optional[dict]:
+    """Render through the persistent worker, or return None to fall back to the CLI"""
+    global _quicktype_worker, _quicktype_worker_failed
+    
+    worker = get_quicktype_worker()
+    if worker is None:
+        return None
+        
+    response = worker.render(sources, options, timeout)
+    if response is None:
+        # The worker is gone; the CLI takes over for the rest of this process
+        _quicktype_worker = None
+        _quicktype_worker_failed = True
+    return response
+    
+
+# Threads overlapping schema file reads during the scan
+SCAN_THREADS = 32
+
+# Schema paths (relative to schemas_dir) assigned to each build level, checked in order
+LEVEL_PATTERNS = (
+    # Level 0: Primitives (no dependencies)
+    (BuildLevel.PRIMITIVES, (
+        "snippets/types/primitives/*.json",
+    )),
+    # Level 1: Simple types
+    (BuildLevel.SIMPLE_TYPES, (
+        "snippets/types/physics/ComplexNumber.json",
+        "snippets/types/physics/Vec3.json",
+        "snippets/types/physics/Vec6.json",
+        "snippets/types/classification/*.json",
+        "snippets/types/social/RelationshipType.json",
+        "snippets/types/social/BondEvent.json",
+        "snippets/types/lifecycles/*.json",
+    )),
+    # Level 2: Complex physics types
+    (BuildLevel.COMPLEX_TYPES, (
+        "snippets/types/physics/DensityMatrix.json",
+        "snippets/types/physics/EntanglementMap.json",
+        "snippets/types/physics/PhysicsConstants.json",
+        "snippets/types/physics/AbstractionLevel.json",
+        "snippets/types/physics/CognitivePerspective.json",
+        "snippets/types/physics/FilamentType.json",
+        "snippets/types/physics/MotifType.json",
+    )),
+    # Level 3: Fields
+    (BuildLevel.FIELDS, (
+        "snippets/fields/*.json",
+    )),
+    # Level 4: Base schemas and components
+    (BuildLevel.COMPONENTS, (
+        "_base/*.schema.json",
+        "components/*.schema.json",
+    )),
+    # Level 5: Entities
+    (BuildLevel.ENTITIES, (
+        "entities/*.schema.json",
+    )),
+)
+
+def _glob_regex(pattern: str) -> str:
+    """Translate a glob pattern to a regex whose wildcards stay within one path segment"""
+    return re.escape(pattern).replace(r'\*', '[^/]*').replace(r'\?', '[^/]')
+
+# One regex per level; group pN records which of the level's patterns matched
+LEVEL_RES = tuple(
+    re.compile('|'.join(f'(?P<p{i}>{_glob_regex(pattern)})' for i, pattern in enumerate(patterns)))
+    for _, patterns in LEVEL_PATTERNS
+)
+
+
 class RecursiveSchemaBuild:
     """Recursive schema build system"""
     
-    def __init__(self, schemas_dir: Path, output_dir: Path):
+    def __init__(self, schemas_dir: Path, output_dir: Path, jobs: Optional[int] = None):
         self.schemas_dir = schemas_dir.resolve()
         self.output_dir = output_dir.resolve()
+        self.jobs = jobs or os.cpu_count() or 1
+        self.cache_dir = self.output_dir / ".cache"
+        # Scratch directory for batched quicktype inputs, shared by all levels
+        self._scratch_dir: Optional[str] = None
         self.schemas: Dict[str, SchemaInfo] = {}
+        self._all_json: List[Tuple[str, Path]] = []
+        # Raw schema bytes read during the scan, consumed by preprocessing
+        self._sources: Dict[str, bytes] = {}
         self.build_order: List[List[SchemaInfo]] = [[] for _ in range(6)]
+        self.antichains: List[List[SchemaInfo]] = []
         self.stats = {
             'total': 0,
             'success': 0,
             'failed': 0,
             'by_level': [0] * 6,
             'success_by_level': [0] * 6,
+            # Preprocessing fixes, reported once per level
+            'enum_const_fixed': 0,
+            'newtype_marked': 0,
         }
         
     def scan_schemas(self):
         """Scan all schemas and categorize by level"""
         print("🔍 Scanning schemas...")
+        self._index_files()
         
-        # Level 0: Primitives (no dependencies)
-        self._scan_level(
-            BuildLevel.PRIMITIVES,
-            ["snippets/types/primitives/*.json"]
-        )
-        
-        # Level 1: Simple types
-        self._scan_level(
-            BuildLevel.SIMPLE_TYPES,
-            [
-                "snippets/types/physics/ComplexNumber.json",
-                "snippets/types/physics/Vec3.json",
-                "snippets/types/physics/Vec6.json",
-                "snippets/types/classification/*.json",
-                "snippets/types/social/RelationshipType.json",
-                "snippets/types/social/BondEvent.json",
-                "snippets/types/lifecycles/*.json",
-            ]
-        )
-        
-        # Level 2: Complex physics types
-        self._scan_level(
-            BuildLevel.COMPLEX_TYPES,
-            [
-                "snippets/types/physics/DensityMatrix.json",
-                "snippets/types/physics/EntanglementMap.json",
-                "snippets/types/physics/PhysicsConstants.json",
-                "snippets/types/physics/AbstractionLevel.json",
-                "snippets/types/physics/CognitivePerspective.json",
-                "snippets/types/physics/FilamentType.json",
-                "snippets/types/physics/MotifType.json",
-            ]
-        )
-        
-        # Level 3: Fields
-        self._scan_level(
-            BuildLevel.FIELDS,
-            ["snippets/fields/*.json"]
-        )
-        
-        # Level 4: Base schemas and components
-        self._scan_level(
-            BuildLevel.COMPONENTS,
-            [
-                "_base/*.schema.json",
-                "components/*.schema.json",
-            ]
-        )
-        
-        # Level 5: Entities
-        self._scan_level(
-            BuildLevel.ENTITIES,
-            ["entities/*.schema.json"]
-        )
-        
+        self._scan_levels()
+        self._order_by_dependencies()
         self._print_scan_summary()
         
-    def _scan_level(self, level: BuildLevel, patterns: List[str]):
-        """Scan schemas matching patterns into a level"""
-        for pattern in patterns:
-            for schema_path in self.schemas_dir.glob(pattern):
-                if schema_path.is_file() and schema_path.suffix == '.json':
-                    self._add_schema(schema_path, level.value)
+    def _index_files(self):
+        """Index every .json file under schemas_dir in one scandir walk"""
+        self._all_json = []
+        stack = [(str(self.schemas_dir), "")]
+        while stack:
+            dir_path, rel_dir = stack.pop()
+            with os.scandir(dir_path) as entries:
+                for entry in entries:
+                    rel_path = rel_dir + entry.name
+                    if entry.is_dir():
+                        stack.append((entry.path, rel_path + "/"))
+                    elif entry.name.endswith('.json') and entry.is_file():
+                        self._all_json.append((rel_path, Path(entry.path)))
+        
+    def _scan_levels(self):
+        """Assign indexed schemas to levels in one pass over the file index"""
+        # Each file goes to the first level whose patterns match it
+        matches: List[List[Tuple[int, str, Path]]] = [[] for _ in LEVEL_PATTERNS]
+        for rel_path, schema_path in self._all_json:
+            for bucket, level_re in zip(matches, LEVEL_RES):
+                match = level_re.fullmatch(rel_path)
+                if match:
+                    bucket.append((int(match.lastgroup[1:]), rel_path, schema_path))
+                    break
                     
-    def _add_schema(self, path: Path, level: int):
-        """Add a schema to the build order"""
-        schema_name = self._get_schema_name(path)
-        
-        # Skip duplicates
-        if schema_name in self.schemas:
-            return
+        # Resolve duplicate names before reading anything: in pattern order,
+        # then index order, the first schema with a given name wins
+        selected = []
+        seen = set(self.schemas)
+        for (level, _), bucket in zip(LEVEL_PATTERNS, matches):
+            bucket.sort(key=lambda item: item[0])
+            for _, rel_path, schema_path in bucket:
+                schema_name = sys.intern(self._get_schema_name(schema_path))
+                if schema_name not in seen:
+                    seen.add(schema_name)
+                    selected.append((schema_path, schema_name, level.value, rel_path))
+                    
+        # Reads are I/O-bound and release the GIL, so overlap them; results
+        # come back in order and are registered serially
+        with ThreadPoolExecutor(max_workers=SCAN_THREADS) as executor:
+            for schema_info, source in executor.map(lambda args: self._read_schema(*args), selected):
+                self._add_schema(schema_info, source)
+                
+    def _read_schema(self, path: Path, schema_name: str, level: int,
+                     rel_path: str) -> Tuple[SchemaInfo, Optional[bytes]]:
+        """Read a schema file and describe it; safe to run on a worker thread"""
+        # Read once; preprocessing reuses (and then drops) these bytes
+        try:
+            source = path.read_bytes()
+        except OSError as e:
+            print(f"⚠️  Failed to analyze {path}: {e}")
+            source = None
             
         # Analyze dependencies
-        dependencies = self._analyze_dependencies(path)
+        dependencies = self._analyze_dependencies(path, source) if source is not None else set()
         
         # Determine category
-        category = self._categorize_schema(path)
+        category = sys.intern(self._categorize_schema(rel_path))
         
         schema_info = SchemaInfo(
             path=path,
             name=schema_name,
             level=level,
-            dependencies=dependencies,
-            category=category
+            dependencies=frozenset(dependencies),
+            category=category,
+            rel_path=rel_path,
         )
+        return schema_info, source
         
-        self.schemas[schema_name] = schema_info
-        self.build_order[level].append(schema_info)
+    def _add_schema(self, schema_info: SchemaInfo, source: Optional[bytes]):
+        """Add a schema to the build order"""
+        if source is not None:
+            self._sources[schema_info.name] = source
+            
+        self.schemas[schema_info.name] = schema_info
+        self.build_order[schema_info.level].append(schema_info)
         self.stats['total'] += 1
-        self.stats['by_level'][level] += 1
+        self.stats['by_level'][schema_info.level] += 1
         
     def _get_schema_name(self, path: Path) -> str:
         """Extract clean schema name from path"""
-        name = path.name
-        
-        # Remove extensions
-        if name.endswith('.event.schema.json'):
-            name = name.replace('.event.schema.json', '')
-        elif name.endswith('.table.schema.json'):
-            name = name.replace('.table.schema.json', '')
-        elif name.endswith('.schema.json'):
-            name = name.replace('.schema.json', '')
-        elif name.endswith('.json'):
-            name = name.replace('.json', '')
-            
-        return name
+        return schema_name_from_filename(path.name)
         
-    def _analyze_dependencies(self, path: Path) -> Set[str]:
-        """Extract $ref dependencies from schema"""
+    def _analyze_dependencies(self, path: Path, source: bytes) -> Set[str]:
+        """Extract $ref dependencies from a schema's raw bytes"""
         dependencies = set()
         
         try:
-            with open(path, 'r') as f:
-                content = json.load(f)
-                self._extract_refs(content, dependencies)
+            # Only the $ref strings matter here, so scan the raw bytes instead of parsing.
+            # Quotes inside JSON strings are escaped, so string content can't match.
+            for match in _REF_RE.finditer(source):
+                ref = match.group(1)
+                if ref.startswith(b'#'):
+                    # Refs within the same document are not file dependencies
+                    continue
+                ref = json_loads(b'"' + ref + b'"') if b'\\' in ref else ref.decode('utf-8')
+                # Names recur across many schemas; share one string object each
+                dependencies.add(sys.intern(self._ref_name(ref)))
         except Exception as e:
             print(f"⚠️  Failed to analyze {path}: {e}")
             
         return dependencies
         
-    def _extract_refs(self, obj: any, refs: Set[str]):
-        """Recursively extract $ref values"""
-        if isinstance(obj, dict):
-            if '$ref' in obj:
-                ref = obj['$ref']
-                # Extract just the filename
-                if '/' in ref:
-                    ref = ref.split('/')[-1]
-                if ref.endswith('.json'):
-                    ref = ref.replace('.json', '')
-                refs.add(ref)
-            for value in obj.values():
-                self._extract_refs(value, refs)
-        elif isinstance(obj, list):
-            for item in obj:
-                self._extract_refs(item, refs)
-                
-    def _categorize_schema(self, path: Path) -> str:
-        """Determine schema category from path"""
-        relative = path.relative_to(self.schemas_dir)
-        parts = relative.parts
-        
-        if len(parts) >= 2:
-            return parts[0]  # entities, components, etc.
+    @staticmethod
+    def _ref_name(ref: str) -> str:
+        """Reduce a $ref to the referenced schema's name"""
+        # Extract just the filename
+        ref = ref.rpartition('/')[2]
+        if ref.endswith('.json'):
+            ref = ref[:-5]
+        return ref
+        
+    def _categorize_schema(self, rel_path: str) -> str:
+        """Determine schema category from its path relative to schemas_dir"""
+        top, sep, _ = rel_path.partition('/')
+        if sep:
+            return top  # entities, components, etc.
         return "root"
         
+    def _compute_antichains(self) -> List[List[SchemaInfo]]:
+        """Group schemas into topological antichains with Kahn's algorithm
+        
+        Antichain 0 holds schemas with no known dependencies, and each later
+        antichain only depends on earlier ones. Schemas caught in a cycle are
+        returned together as a final antichain.
+        """
+        # Only edges between scanned schemas count; self-references are fine
+        dependents: Dict[str, List[str]] = {name: [] for name in self.schemas}
+        in_degree: Dict[str, int] = {}
+        for name, schema in self.schemas.items():
+            deps = {dep for dep in schema.dependencies if dep in self.schemas and dep != name}
+            in_degree[name] = len(deps)
+            for dep in deps:
+                dependents[dep].append(name)
+                
+        ready = deque(name for name, degree in in_degree.items() if degree == 0)
+        antichains = []
+        while ready:
+            antichain = list(ready)
+            ready.clear()
+            antichains.append([self.schemas[name] for name in antichain])
+            for name in antichain:
+                for dependent in dependents[name]:
+                    in_degree[dependent] -= 1
+                    if in_degree[dependent] == 0:
+                        ready.append(dependent)
+                        
+        cyclic = [self.schemas[name] for name, degree in in_degree.items() if degree > 0]
+        if cyclic:
+            print(f"⚠️  Dependency cycle among: {', '.join(s.name for s in cyclic)}")
+            antichains.append(cyclic)
+        return antichains
+        
+    def _order_by_dependencies(self):
+        """Order each level topologically and flag schemas that depend on a higher level"""
+        self.antichains = self._compute_antichains()
+        position = {
+            schema.name: index
+            for index, antichain in enumerate(self.antichains)
+            for schema in antichain
+        }
+        
+        # Stable sort keeps scan order among independent schemas
+        for schemas in self.build_order:
+            schemas.sort(key=lambda schema: position[schema.name])
+            
+        for schema in self.schemas.values():
+            for dep in sorted(schema.dependencies):
+                dep_info = self.schemas.get(dep)
+                if dep_info is not None and dep_info.level > schema.level:
+                    print(f"⚠️  {schema.name} (Level {schema.level}) depends on "
+                          f"{dep} (Level {dep_info.level})")
+                          
     def _print_scan_summary(self):
         """Print summary of scanned schemas"""
         print(f"\n📊 Scanned {self.stats['total']} schemas:")
@@ -223,16 +528,24 @@ class RecursiveSchemaBuild:
             count = self.stats['by_level'][level]
             print(f"  Level {level} ({level_names[level]:15s}): {count:3d} schemas")
             
+        print(f"  Dependency depth: {len(self.antichains)} stages")
+        
     def build_all(self) -> bool:
         """Execute full recursive build"""
         print("\n" + "="*60)
         print("🚀 Starting Recursive Build")
         print("="*60)
         
-        for level in range(6):
-            if not self._build_level(level):
-                print(f"\n❌ Build failed at Level {level}")
-                return False
+        try:
+            for level in range(6):
+                if not self._build_level(level):
+                    print(f"\n❌ Build failed at Level {level}")
+                    return False
+        finally:
+            # One removal for every scratch file of the build
+            if self._scratch_dir is not None:
+                shutil.rmtree(self._scratch_dir, ignore_errors=True)
+                self._scratch_dir = None
                 
         self._print_final_summary()
         return True
@@ -256,179 +569,335 @@ class RecursiveSchemaBuild:
         level_output = self.output_dir / f"level_{level}_{level_names[level].lower().replace(' ', '_')}"
         level_output.mkdir(parents=True, exist_ok=True)
         
-        success_count = 0
-        fail_count = 0
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        
+        # One directory read answers every "already built?" question for the level
+        existing = set(os.listdir(level_output))
         
+        results = []
+        hashed = []
+        hashes = {}
         for schema in schemas:
             try:
-                # Preprocess schema for Rust compatibility
-                processed = self._preprocess_schema(schema, level)
-                
-                # Generate Rust code
-                rust_generated = self._generate_rust(schema, processed, level, level_output)
+                h, source = self._hash_source(schema, level)
+                hashes[schema.name] = h
+                hashed.append((schema, source))
+            except Exception as e:
+                results.append((schema.name, False, str(e)))
                 
-                if rust_generated:
-                    success_count += 1
-                    self.stats['success'] += 1
-                    self.stats['success_by_level'][level] += 1
-                    print(f"  ✅ {schema.name}")
-                else:
-                    fail_count += 1
-                    self.stats['failed'] += 1
-                    print(f"  ⚠️  {schema.name} (generation returned no output)")
-                    
+        # Fast path: every output is current, so skip preprocessing and generation
+        if all(self._is_current(existing, schema.name, hashes[schema.name], LEVEL_OUTPUT_FILE)
+               or self._is_current(existing, schema.name, hashes[schema.name], f"{schema.name}.rs")
+               for schema, _ in hashed):
+            results.extend((schema.name, True, None) for schema, _ in hashed)
+            hashed = []
+            
+        pairs = []
+        enum_const_before = self.stats['enum_const_fixed']
+        newtype_before = self.stats['newtype_marked']
+        for schema, source in hashed:
+            try:
+                # Preprocess schema for Rust compatibility
+                processed = self._load_preprocessed(schema, level, hashes[schema.name], source)
+                pairs.append((schema, processed))
             except Exception as e:
-                fail_count += 1
-                self.stats['failed'] += 1
-                print(f"  ❌ {schema.name}: {e}")
+                results.append((schema.name, False, str(e)))
+                
+        enum_const = self.stats['enum_const_fixed'] - enum_const_before
+        newtype = self.stats['newtype_marked'] - newtype_before
+        if enum_const or newtype:
+            print(f"  🔧 enum+const: {enum_const}, newtype: {newtype}")
+            
+        if pairs:
+            results.extend(self._generate_level(pairs, hashes, level, level_output, existing))
+            
+        success_count, fail_count = self._record_results(level, results)
                 
         print(f"\nLevel {level} Results: {success_count} success, {fail_count} failed")
         return True  # Continue even if some fail
         
-    def _preprocess_schema(self, schema: SchemaInfo, level: int) -> dict:
-        """Preprocess schema for Rust compatibility"""
-        with open(schema.path, 'r') as f:
-            content = json.load(f)
-            
-        # Apply preprocessing based on level
-        if level >= BuildLevel.ENTITIES.value:
-            content = self._fix_enum_const_conflicts(content)
+    def _hash_source(self, schema: SchemaInfo, level: int) -> Tuple[str, bytes]:
+        """Return (hash, source bytes) identifying a schema's preprocessed form"""
+        source = self._sources.pop(schema.name, None)
+        if source is None:
+            source = schema.path.read_bytes()
+        h = hashlib.blake2b(
+            source + PREPROC_VERSION + str(level).encode(), digest_size=16
+        ).hexdigest()
+        return h, source
+        
+    def _load_preprocessed(self, schema: SchemaInfo, level: int, h: str, source: bytes) -> bytes:
+        """Return processed JSON bytes, reusing the cached result when the source is unchanged"""
+        cache_file = self.cache_dir / f"{h}.json"
+        try:
+            return cache_file.read_bytes()
+        except FileNotFoundError:
+            pass
             
-        if level >= BuildLevel.COMPLEX_TYPES.value:
-            content = self._fix_constrained_numerics(content)
+        processed = json_dumps_indented(self._preprocess_schema(schema, level, source))
+        # Write then rename so parallel or interrupted runs never leave a partial entry
+        tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        tmp_file.write_bytes(processed)
+        os.replace(tmp_file, cache_file)
+        return processed
+        
+    @staticmethod
+    def _stamp_name(name: str, h: str) -> str:
+        """Empty marker file recording the input hash a schema's Rust output came from"""
+        return f".{name}.{h}.stamp"
+        
+    def _is_current(self, existing: Set[str], name: str, h: str, output_file: str) -> bool:
+        """Whether output_file exists and was generated from input hash h"""
+        return self._stamp_name(name, h) in existing and output_file in existing
+        
+    def _set_stamp(self, level_output: Path, existing: Set[str], name: str, h: Optional[str]):
+        """Record hash h as current for a schema, or clear its stamps when h is None"""
+        stamp = self._stamp_name(name, h) if h is not None else None
+        prefix = f".{name}."
+        stamp_len = len(self._stamp_name(name, '0' * 32))
+        for entry in existing:
+            if entry != stamp and entry.startswith(prefix) and entry.endswith('.stamp') \
+                    and len(entry) == stamp_len:
+                (level_output / entry).unlink(missing_ok=True)
+        if stamp is not None:
+            (level_output / stamp).touch()
             
-        content = self._clean_for_rust(content)
-        
-        return content
-        
-    def _fix_enum_const_conflicts(self, schema: dict) -> dict:
-        """Fix enum + const conflicts that break Rust generators"""
-        def fix_recursive(obj):
-            if isinstance(obj, dict):
-                # If both enum and const exist, remove enum (keep const for specificity)
-                if 'enum' in obj and 'const' in obj:
-                    del obj['enum']
-                    print(f"    🔧 Fixed enum+const conflict")
-                    
-                for key, value in obj.items():
-                    obj[key] = fix_recursive(value)
-                    
-            elif isinstance(obj, list):
-                return [fix_recursive(item) for item in obj]
-                
-            return obj
+
+    def _generate_level(self, pairs: List[Tuple[SchemaInfo, bytes]], hashes: Dict[str, str],
+                        level: int, level_output: Path,
+                        existing: Set[str]) -> List[Tuple[str, bool, Optional[str]]]:
+        """Generate Rust for a level's preprocessed schemas, returning (name, ok, err) results
+        
+        existing is the listing of level_output taken before generation started.
+        """
+        # One quicktype run for the whole level pays Node startup only once
+        if len(pairs) > 1 and self._generate_level_with_quicktype(pairs, level, level_output):
+            # Drop per-schema files left over from earlier unbatched builds
+            for schema, _ in pairs:
+                (level_output / f"{schema.name}.rs").unlink(missing_ok=True)
+                self._set_stamp(level_output, existing, schema.name, hashes[schema.name])
+            return [(schema.name, True, None) for schema, _ in pairs]
             
-        return fix_recursive(schema)
-        
-    def _fix_constrained_numerics(self, schema: dict) -> dict:
-        """Transform constrained numerics to newtype hints"""
-        def fix_recursive(obj):
-            if isinstance(obj, dict):
-                # Detect constrained numeric
-                if obj.get('type') == 'number' and ('minimum' in obj or 'maximum' in obj):
-                    # Mark for newtype generation
-                    obj['x-rust-newtype'] = True
-                    obj['x-rust-validation'] = {
-                        'min': obj.pop('minimum', None),
-                        'max': obj.pop('maximum', None),
-                    }
-                    print(f"    🔧 Marked constrained numeric for newtype")
-                    
-                for key, value in obj.items():
-                    obj[key] = fix_recursive(value)
-                    
-            elif isinstance(obj, list):
-                return [fix_recursive(item) for item in obj]
+        (level_output / LEVEL_OUTPUT_FILE).unlink(missing_ok=True)
+        existing.discard(LEVEL_OUTPUT_FILE)
+        
+        # Otherwise build per schema, which pins each failure to its schema;
+        # schemas whose own file is already current are skipped
+        results = []
+        stale = []
+        for schema, processed in pairs:
+            if self._is_current(existing, schema.name, hashes[schema.name], f"{schema.name}.rs"):
+                results.append((schema.name, True, None))
+            else:
+                stale.append((schema, processed))
                 
-            return obj
+        # Schemas within a level only depend on lower levels, so they can be
+        # built in any order; each one is mostly a blocking quicktype run
+        if self.jobs > 1 and len(stale) > 1:
+            with ProcessPoolExecutor(max_workers=min(self.jobs, len(stale))) as executor:
+                futures = [executor.submit(_build_one, schema, processed, level, level_output)
+                           for schema, processed in stale]
+                built = [future.result() for future in as_completed(futures)]
+        else:
+            built = [_build_one(schema, processed, level, level_output) for schema, processed in stale]
             
-        return fix_recursive(schema)
+        for name, ok, _ in built:
+            self._set_stamp(level_output, existing, name, hashes[name] if ok else None)
+        return results + built
         
-    def _clean_for_rust(self, schema: dict) -> dict:
-        """Remove Rust-incompatible extensions"""
-        extensions_to_remove = [
-            'category', 'source_file', 'schema_version',
-            'physics_properties',
-        ]
+    def _record_results(self, level: int, results) -> Tuple[int, int]:
+        """Update stats from (name, ok, err) build results and report each one"""
+        success_count = 0
+        fail_count = 0
         
-        def clean_recursive(obj):
-            if isinstance(obj, dict):
-                for ext in extensions_to_remove:
-                    if ext in obj:
-                        del obj[ext]
-                        
-                for key, value in obj.items():
-                    obj[key] = clean_recursive(value)
-                    
-            elif isinstance(obj, list):
-                return [clean_recursive(item) for item in obj]
+        for name, ok, err in results:
+            if ok:
+                success_count += 1
+                self.stats['success'] += 1
+                self.stats['success_by_level'][level] += 1
+                print(f"  ✅ {name}")
+            elif err is None:
+                fail_count += 1
+                self.stats['failed'] += 1
+                print(f"  ⚠️  {name} (generation returned no output)")
+            else:
+                fail_count += 1
+                self.stats['failed'] += 1
+                print(f"  ❌ {name}: {err}")
                 
-            return obj
+        return success_count, fail_count
+        
+    def _preprocess_schema(self, schema: SchemaInfo, level: int,
+                           source: Optional[bytes] = None) -> dict:
+        """Preprocess schema for Rust compatibility, from source bytes if already read"""
+        content = json_loads(source if source is not None else schema.path.read_bytes())
+            
+        # Pick the fixes for this level, then apply them all in one in-place walk
+        rules = []
+        if level >= BuildLevel.ENTITIES.value:
+            rules.append(functools.partial(_fix_enum_const_node, stats=self.stats))
+            
+        if level >= BuildLevel.COMPLEX_TYPES.value:
+            rules.append(functools.partial(_fix_constrained_numeric_node, stats=self.stats))
             
-        return clean_recursive(schema)
+        rules.append(_clean_for_rust_node)
         
-    def _generate_rust(self, schema: SchemaInfo, processed: dict, 
+        return walk_and_transform(content, rules)
+        
+    def _generate_rust(self, schema: SchemaInfo, processed: bytes, 
                       level: int, output_dir: Path) -> bool:
         """Generate Rust code using appropriate strategy per level"""
-        
-        # Write processed schema to temp file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(processed, f, indent=2)
-            temp_path = f.name
+        # Choose generation strategy based on level
+        if level <= BuildLevel.COMPLEX_TYPES.value:
+            # Use quicktype for simple types
+            return self._generate_with_quicktype(schema, processed, output_dir)
+        elif level == BuildLevel.FIELDS.value:
+            # Use quicktype with type aliases
+            return self._generate_with_quicktype(schema, processed, output_dir, use_aliases=True)
+        else:
+            # For components and entities, try quicktype but expect some failures
+            # In the future, this will use custom templates
+            return self._generate_with_quicktype(schema, processed, output_dir)
             
-        try:
-            # Choose generation strategy based on level
-            if level <= BuildLevel.COMPLEX_TYPES.value:
-                # Use quicktype for simple types
-                return self._generate_with_quicktype(schema, temp_path, output_dir)
-            elif level == BuildLevel.FIELDS.value:
-                # Use quicktype with type aliases
-                return self._generate_with_quicktype(schema, temp_path, output_dir, use_aliases=True)
-            else:
-                # For components and entities, try quicktype but expect some failures
-                # In the future, this will use custom templates
-                return self._generate_with_quicktype(schema, temp_path, output_dir)
-                
-        finally:
-            # Clean up temp file
-            if os.path.exists(temp_path):
-                os.unlink(temp_path)
-                
-    def _generate_with_quicktype(self, schema: SchemaInfo, schema_path: str, 
-                                output_dir: Path, use_aliases: bool = False) -> bool:
-        """Generate Rust code using quicktype"""
+    @staticmethod
+    def _rust_options(use_aliases: bool = False) -> Dict[str, str]:
+        """quicktype Rust renderer options for a build"""
+        options = dict(QUICKTYPE_RUST_OPTIONS)
+        if use_aliases:
+            options["use-default-for-missing"] = "true"
+        return options
         
-        output_file = output_dir / f"{schema.name}.rs"
+    @staticmethod
+    def _quicktype_command(output_file: Path, sources: List[str], options: Dict[str, str],
+                           top_level: Optional[str] = None) -> List[str]:
+        """Build a quicktype command line emitting Rust for the given schema files
         
+        With no sources quicktype reads the schema from stdin, naming its type top_level.
+        """
         cmd = [
             "quicktype",
             "--src-lang", "schema",
             "--lang", "rust",
-            "--derive-debug",
-            "--derive-clone",
-            "--visibility", "public",
-            "--density", "dense",
-            "--out", str(output_file),
-            schema_path
         ]
-        
-        if use_aliases:
-            cmd.append("--use-default-for-missing")
+        for option, value in options.items():
+            # Boolean options are bare flags on the command line
+            cmd.extend([f"--{option}"] if value == "true" else [f"--{option}", value])
+        cmd.extend(["--out", str(output_file)])
+        
+        # A single source is passed bare, several as repeated --src
+        if not sources:
+            cmd.extend(["--top-level", top_level])
+        elif len(sources) == 1:
+            cmd.append(sources[0])
+        else:
+            for source in sources:
+                cmd.extend(["--src", source])
+                
+        return cmd
+        
+    def _generate_level_with_quicktype(self, pairs: List[Tuple[SchemaInfo, bytes]],
+                                       level: int, output_dir: Path) -> bool:
+        """Generate one combined Rust file for a whole level with a single quicktype run"""
+        output_file = output_dir / LEVEL_OUTPUT_FILE
+        options = self._rust_options(use_aliases=level == BuildLevel.FIELDS.value)
+        # Scale the per-schema budget with the batch size
+        timeout = 30 * len(pairs)
+        
+        response = render_with_worker(
+            [(schema.name, processed) for schema, processed in pairs], options, timeout
+        )
+        if response is not None:
+            if response['ok']:
+                output_file.write_text(response['rust'])
+                return True
+            failing = [schema.name for schema, _ in pairs if schema.name in response['error']]
+            return self._report_batch_failure(failing)
+            
+        # Several sources can't share stdin, so this is the one place schemas hit disk.
+        # Schema names are unique across levels, so one directory serves the whole build
+        if self._scratch_dir is None:
+            self._scratch_dir = tempfile.mkdtemp(prefix="familiar_build_")
+        temp_paths = []
+        for schema, processed in pairs:
+            # Name the file after the schema so quicktype names its type to match
+            temp_path = os.path.join(self._scratch_dir, f"{schema.name}.json")
+            with open(temp_path, 'wb') as f:
+                f.write(processed)
+            temp_paths.append(temp_path)
             
+        cmd = self._quicktype_command(output_file, temp_paths, options)
+        
         try:
+            # --out writes the file; only stderr is worth keeping
             result = subprocess.run(
                 cmd,
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 text=True,
+                timeout=timeout
+            )
+        except (subprocess.TimeoutExpired, OSError):
+            return False
+            
+
+        if result.returncode == 0:
+            return True
+            
+        # quicktype stops at the first bad schema; name it when the error says which
+        failing = [schema.name for (schema, _), temp_path in zip(pairs, temp_paths)
+                   if temp_path in result.stderr]
+        return self._report_batch_failure(failing)
+        
+    @staticmethod
+    def _report_batch_failure(failing: List[str]) -> bool:
+        """Announce the per-schema fallback after a failed batch; always returns False"""
+        if failing:
+            print(f"  ↩️  Batched quicktype failed on {', '.join(failing)}; building schemas individually")
+        else:
+            print("  ↩️  Batched quicktype failed; building schemas individually")
+        return False
+        
+    @staticmethod
+    def _report_quicktype_error(error: str):
+        # Don't print full error for expected failures
+        if "not yet implemented" not in error:
+            print(f"      Error: {error[:100]}...")
+            
+    def _generate_with_quicktype(self, schema: SchemaInfo, processed: bytes, 
+                                output_dir: Path, use_aliases: bool = False) -> bool:
+        """Generate Rust code using quicktype
+        
+        Goes through the persistent worker when it is available, otherwise pipes
+        the processed schema to the quicktype CLI over stdin.
+        """
+        
+        output_file = output_dir / f"{schema.name}.rs"
+        options = self._rust_options(use_aliases)
+        
+        response = render_with_worker([(schema.name, processed)], options, timeout=30)
+        if response is not None:
+            if response['ok']:
+                output_file.write_text(response['rust'])
+                return True
+            self._report_quicktype_error(response['error'])
+            return False
+            
+        cmd = self._quicktype_command(output_file, [], options, top_level=schema.name)
+            
+        try:
+            # --out writes the file; only stderr is worth keeping
+            result = subprocess.run(
+                cmd,
+                input=processed,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 timeout=30
             )
             
             if result.returncode == 0:
                 return True
             else:
-                # Don't print full error for expected failures
-                if "not yet implemented" not in result.stderr:
-                    print(f"      Error: {result.stderr[:100]}...")
+                self._report_quicktype_error(result.stderr.decode('utf-8', errors='replace'))
                 return False
                 
         except subprocess.TimeoutExpired:
@@ -475,6 +944,20 @@ class RecursiveSchemaBuild:
                 print(f"  Level {level} ({level_names[level]:15s}): {success_level:3d}/{total_level:3d} ({rate:5.1f}%)")
                 
 
+def _build_one(schema: SchemaInfo, processed: bytes, level: int,
+               level_output: Path) -> Tuple[str, bool, Optional[str]]:
+    """Generate Rust for one preprocessed schema (worker entry point).
+    
+    Returns (name, ok, err); err is None unless an exception was raised.
+    """
+    # Generation only reads its arguments, never builder state
+    builder = RecursiveSchemaBuild(schema.path.parent, level_output)
+    try:
+        return schema.name, builder._generate_rust(schema, processed, level, level_output), None
+    except Exception as e:
+        return schema.name, False, str(e)
+        
+
 def main():
     """Main entry point"""
     import argparse
@@ -495,6 +978,13 @@ def main():
         help="Output directory for generated Rust code"
     )
     
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=os.cpu_count(),
+        help="Number of schemas to build in parallel within a level (default: CPU count)"
+    )
+    
     args = parser.parse_args()
     
     # Validate inputs
@@ -503,7 +993,7 @@ def main():
         return 1
         
     # Create builder
-    builder = RecursiveSchemaBuild(args.schemas_dir, args.output_dir)
+    builder = RecursiveSchemaBuild(args.schemas_dir, args.output_dir, jobs=args.jobs)
     
     # Scan and build
     builder.scan_schemas()
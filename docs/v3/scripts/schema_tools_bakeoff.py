@@ -11,16 +11,44 @@ Tests tools on the HARDEST schemas - complex entities and physics components:
 Focus: Complex schemas with polymorphism, physics variables, nested structures
 """
 
+import argparse
 import json
 import os
 import subprocess
 import time
 import tempfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from functools import partial
 from pathlib import Path
 from dataclasses import dataclass
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Union
 import shutil
 
+from schema_walker import walk_and_transform
+from generate_rust_from_assembled import TYPIFY_CLEANUP_RULES
+
+try:
+    # orjson is a much faster drop-in for load/dump when available
+    import orjson
+except ImportError:
+    orjson = None
+
+def json_loads(data):
+    """Parse JSON from bytes or str."""
+    return orjson.loads(data) if orjson else json.loads(data)
+
+def json_dumps(obj) -> bytes:
+    """Serialize to compact UTF-8 JSON bytes."""
+    if orjson:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+def json_dumps_indented(obj) -> bytes:
+    """Serialize to UTF-8 JSON bytes with 2-space indentation."""
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode('utf-8')
+
 @dataclass
 class ToolResult:
     name: str
@@ -33,10 +61,23 @@ class ToolResult:
 @dataclass
 class SchemaResult:
     schema_name: str
-    typify: ToolResult
-    entype: ToolResult
-    quicktype: ToolResult
-    schemafy: Optional[ToolResult] = None
+    tools: Dict[str, ToolResult]
+    
+    @property
+    def typify(self) -> ToolResult:
+        return self.tools["typify"]
+    
+    @property
+    def entype(self) -> ToolResult:
+        return self.tools["entype"]
+    
+    @property
+    def quicktype(self) -> ToolResult:
+        return self.tools["quicktype"]
+    
+    @property
+    def schemafy(self) -> Optional[ToolResult]:
+        return self.tools.get("schemafy")
 
 def select_hard_schemas(all_schemas: List[Path]) -> List[Path]:
     """Select only the hardest, most complex schemas for testing."""
@@ -61,13 +102,10 @@ def select_hard_schemas(all_schemas: List[Path]) -> List[Path]:
         'ThreadContent.schema.json', 'MomentDetails.schema.json'
     ]
     
-    hard_schema_names = entity_schemas + physics_schemas + component_schemas
+    hard_schema_names = frozenset((*entity_schemas, *physics_schemas, *component_schemas))
     
     # Filter to only include schemas that exist
-    hard_schemas = []
-    for schema_file in all_schemas:
-        if schema_file.name in hard_schema_names:
-            hard_schemas.append(schema_file)
+    hard_schemas = [schema_file for schema_file in all_schemas if schema_file.name in hard_schema_names]
     
     print(f"🎯 Selected {len(hard_schemas)} HARD schemas for testing:")
     for schema in hard_schemas:
@@ -75,77 +113,38 @@ def select_hard_schemas(all_schemas: List[Path]) -> List[Path]:
     
     return hard_schemas
 
-def clean_schema_for_typify(schema_data: Dict[str, Any]) -> Dict[str, Any]:
-    """Clean schema using same approach as working generate_rust_from_assembled.py script."""
-    cleaned = json.loads(json.dumps(schema_data))
-    
-    extensions_to_remove = [
-        'x-infrastructure', 'category', 'source_file', 'schema_version',
-        'physics_properties', 'x-python-type', 'x-typescript-type',
-        'x-java-type', 'x-go-type', 'ui_label', 'format'
-    ]
-
-    def clean_nested(obj: Any) -> Any:
-        if isinstance(obj, dict):
-            # Remove typify-incompatible extensions
-            for ext in extensions_to_remove:
-                if ext in obj:
-                    del obj[ext]
-            
-            # Process x-rust-type hints
-            if 'x-rust-type' in obj:
-                rust_type = obj['x-rust-type']
-                del obj['x-rust-type']
-                
-                # Transform schema based on rust type hints
-                if rust_type == 'f64':
-                    obj['type'] = 'number'
-                elif rust_type.startswith('[f64;'):
-                    obj['type'] = 'array'
-                    obj['items'] = {'type': 'number'}
-                    if '; 6]' in rust_type:
-                        obj['minItems'] = 6
-                        obj['maxItems'] = 6
-
-            # Recursively clean nested objects
-            for key, value in list(obj.items()):
-                obj[key] = clean_nested(value)
+def clean_schema_file_for_typify(schema_file: str) -> bytes:
+    """Cleaned schema JSON for a file, using the generate_rust_from_assembled.py cleanup rules."""
+    # The freshly loaded schema is not shared, so it is cleaned in place without a copy
+    schema_data = json_loads(Path(schema_file).read_bytes())
+    return json_dumps_indented(walk_and_transform(schema_data, TYPIFY_CLEANUP_RULES))
 
-            return obj
-        elif isinstance(obj, list):
-            return [clean_nested(item) for item in obj]
-        return obj
-
-    return clean_nested(cleaned)
-
-def run_command(cmd: List[str], input_data: str = None, timeout: int = 60, cwd: str = None) -> tuple[bool, str, float]:
-    """Run a command and return (success, output/error, execution_time)"""
+def run_command(cmd: List[str], input_data: Union[str, bytes] = None, timeout: int = 60, cwd: str = None,
+                capture: bool = True) -> tuple[bool, str, float]:
+    """Run a command and return (success, output/error, execution_time)
+    
+    With capture=False stdout is discarded (for tools that write their own
+    output file) and a successful run returns an empty output.
+    """
     start_time = time.time()
     try:
-        if input_data:
-            result = subprocess.run(
-                cmd, 
-                input=input_data, 
-                text=True, 
-                capture_output=True, 
-                timeout=timeout,
-                cwd=cwd
-            )
-        else:
-            result = subprocess.run(
-                cmd, 
-                capture_output=True, 
-                text=True, 
-                timeout=timeout,
-                cwd=cwd
-            )
+        # Bytes in and out; only the stream that is actually returned gets decoded
+        result = subprocess.run(
+            cmd,
+            input=input_data.encode('utf-8') if isinstance(input_data, str) else input_data,
+            stdout=subprocess.PIPE if capture else subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            timeout=timeout,
+            cwd=cwd
+        )
         
         execution_time = time.time() - start_time
         
         if result.returncode == 0:
-            return True, result.stdout, execution_time
+            output = result.stdout.decode('utf-8', errors='replace') if capture else ""
+            return True, output, execution_time
         else:
-            return False, result.stderr, execution_time
+            return False, result.stderr.decode('utf-8', errors='replace'), execution_time
             
     except subprocess.TimeoutExpired:
         execution_time = time.time() - start_time
@@ -160,19 +159,18 @@ def test_typify(schema_file: str, output_dir: str) -> ToolResult:
     
     try:
         # Load and clean schema using same method as working script
-        schema_data = json.loads(Path(schema_file).read_text())
-        cleaned_schema = clean_schema_for_typify(schema_data)
+        cleaned_json = clean_schema_file_for_typify(schema_file)
         
-        # Create temporary file with cleaned schema
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(cleaned_schema, f, indent=2)
-            temp_schema_path = f.name
+        # Write the cleaned schema next to the output in the scratch directory
+        temp_schema_path = os.path.join(output_dir, "typify_input.json")
+        with open(temp_schema_path, 'wb') as f:
+            f.write(cleaned_json)
         
         try:
             # Use cargo typify directly like the working script
             success, output, exec_time = run_command([
                 "cargo", "typify", "-o", output_file, temp_schema_path
-            ], timeout=60)
+            ], timeout=60, capture=False)
             
             output_size = 0
             if success and os.path.exists(output_file):
@@ -204,12 +202,12 @@ def test_entype(schema_file: str, output_dir: str) -> ToolResult:
     output_file = os.path.join(output_dir, "entype_output.rs")
     
     try:
-        with open(schema_file, 'r') as f:
-            schema = json.load(f)
+        with open(schema_file, 'rb') as f:
+            schema = json_loads(f.read())
         
         # Create a complex JSON sample from schema
         sample_data = create_complex_sample_from_schema(schema)
-        sample_json = json.dumps(sample_data)
+        sample_json = json_dumps(sample_data)
         
         cmd = ["typegen-json", "--lang", "rust"]
         
@@ -247,7 +245,7 @@ def test_quicktype(schema_file: str, output_dir: str) -> ToolResult:
     cmd = ["quicktype", "--src-lang", "schema", "--lang", "rust", 
            "--src", schema_file, "--out", output_file]
     
-    success, output, exec_time = run_command(cmd, timeout=60)
+    success, output, exec_time = run_command(cmd, timeout=60, capture=False)
     
     output_size = 0
     if success and os.path.exists(output_file):
@@ -286,73 +284,96 @@ def test_schemafy(schema_file: str, output_dir: str) -> ToolResult:
         output_file=output_file if success else None
     )
 
+# Sample values for leaf properties; (type, format) entries win over plain type
+_SAMPLE_BY_FORMAT = {
+    ("string", "uuid"): lambda s: "550e8400-e29b-41d4-a716-446655440000",
+    ("string", "date-time"): lambda s: "2023-01-01T00:00:00Z",
+}
+
+_SAMPLE_BY_TYPE = {
+    "string": lambda s: s["enum"][0] if "enum" in s else "example_string",
+    # Use constraints if available
+    "number": lambda s: (s.get("minimum", 0.0) + s.get("maximum", 100.0)) / 2,
+    "integer": lambda s: (s.get("minimum", 0) + s.get("maximum", 100)) // 2,
+    "boolean": lambda s: True,
+}
+
 def create_complex_sample_from_schema(schema: dict) -> dict:
     """Create a complex JSON sample that exercises nested structures and polymorphism."""
-    if schema.get("type") == "object":
-        result = {}
-        properties = schema.get("properties", {})
+    if schema.get("type") != "object":
+        return {"complex_example": "data"}
+    
+    # Work list of (object schema, sample dict to fill) instead of recursion
+    root = {}
+    pending = [(schema, root)]
+    
+    def object_sample(sub_schema: dict) -> dict:
+        sample = {}
+        pending.append((sub_schema, sample))
+        return sample
+    
+    while pending:
+        object_schema, result = pending.pop()
         
-        for prop_name, prop_schema in properties.items():
+        for prop_name, prop_schema in object_schema.get("properties", {}).items():
             prop_type = prop_schema.get("type", "string")
             
-            if prop_type == "string":
-                # Handle special string types
-                if prop_schema.get("format") == "uuid":
-                    result[prop_name] = "550e8400-e29b-41d4-a716-446655440000"
-                elif prop_schema.get("format") == "date-time":
-                    result[prop_name] = "2023-01-01T00:00:00Z"
-                elif "enum" in prop_schema:
-                    result[prop_name] = prop_schema["enum"][0]
-                else:
-                    result[prop_name] = "example_string"
-            elif prop_type == "number":
-                # Use constraints if available
-                minimum = prop_schema.get("minimum", 0.0)
-                maximum = prop_schema.get("maximum", 100.0)
-                result[prop_name] = (minimum + maximum) / 2
-            elif prop_type == "integer":
-                minimum = prop_schema.get("minimum", 0)
-                maximum = prop_schema.get("maximum", 100)
-                result[prop_name] = (minimum + maximum) // 2
-            elif prop_type == "boolean":
-                result[prop_name] = True
+            if prop_type == "object":
+                result[prop_name] = object_sample(prop_schema)
             elif prop_type == "array":
                 items_schema = prop_schema.get("items", {"type": "string"})
                 if items_schema.get("type") == "number":
                     result[prop_name] = [1.0, 2.0, 3.0]
                 elif items_schema.get("type") == "object":
-                    result[prop_name] = [create_complex_sample_from_schema(items_schema)]
+                    result[prop_name] = [object_sample(items_schema)]
                 else:
                     result[prop_name] = ["item1", "item2"]
-            elif prop_type == "object":
-                result[prop_name] = create_complex_sample_from_schema(prop_schema)
+            elif isinstance(prop_type, str):
+                make = (_SAMPLE_BY_FORMAT.get((prop_type, prop_schema.get("format")))
+                        or _SAMPLE_BY_TYPE.get(prop_type))
+                result[prop_name] = make(prop_schema) if make else None
             else:
                 result[prop_name] = None
-                
-        return result
-    else:
-        return {"complex_example": "data"}
+    
+    return root
 
-def test_schema_with_all_tools(schema_file: str, include_schemafy: bool) -> SchemaResult:
-    """Test a single complex schema with all available tools"""
+def test_schema_with_all_tools(schema_file: str, include_schemafy: bool, scratch_root: str) -> SchemaResult:
+    """Test a single complex schema with all available tools
+    
+    Each worker process reuses one directory under scratch_root for every
+    schema it tests; only the files a run leaves behind are removed.
+    """
     schema_name = os.path.basename(schema_file)
+    temp_dir = os.path.join(scratch_root, str(os.getpid()))
+    os.makedirs(temp_dir, exist_ok=True)
     
-    with tempfile.TemporaryDirectory() as temp_dir:
+    try:
         print(f"  💪 Testing HARD schema: {schema_name}...")
         
-        # Test each tool
-        typify_result = test_typify(schema_file, temp_dir)
-        entype_result = test_entype(schema_file, temp_dir)
-        quicktype_result = test_quicktype(schema_file, temp_dir)
-        schemafy_result = test_schemafy(schema_file, temp_dir) if include_schemafy else None
+        tools = {
+            "typify": test_typify,
+            "entype": test_entype,
+            "quicktype": test_quicktype,
+        }
+        if include_schemafy:
+            tools["schemafy"] = test_schemafy
         
-        return SchemaResult(
-            schema_name=schema_name,
-            typify=typify_result,
-            entype=entype_result,
-            quicktype=quicktype_result,
-            schemafy=schemafy_result
-        )
+        # Each tool is an independent subprocess writing its own output file,
+        # so run them side by side (threads are enough, they wait on children)
+        tool_results = {}
+        with ThreadPoolExecutor(max_workers=len(tools)) as executor:
+            futures = {
+                executor.submit(test_tool, schema_file, temp_dir): name
+                for name, test_tool in tools.items()
+            }
+            for future in as_completed(futures):
+                tool_results[futures[future]] = future.result()
+        
+        return SchemaResult(schema_name=schema_name, tools=tool_results)
+    finally:
+        with os.scandir(temp_dir) as entries:
+            for entry in entries:
+                os.remove(entry.path)
 
 def print_summary_report(results: List[SchemaResult], include_schemafy: bool):
     """Print comprehensive summary report"""
@@ -367,14 +388,17 @@ def print_summary_report(results: List[SchemaResult], include_schemafy: bool):
     if include_schemafy:
         tool_stats["schemafy"] = {"success": 0, "total_time": 0, "total_size": 0}
     
+    tool_failures = {tool_name: [] for tool_name in tool_stats}
+    
     for result in results:
-        for tool_name in tool_stats.keys():
-            tool_result = getattr(result, tool_name)
-            if tool_result and tool_result.success:
-                tool_stats[tool_name]["success"] += 1
-                tool_stats[tool_name]["total_size"] += tool_result.output_size
-            if tool_result:
-                tool_stats[tool_name]["total_time"] += tool_result.execution_time
+        for tool_name, tool_result in result.tools.items():
+            stats = tool_stats[tool_name]
+            if tool_result.success:
+                stats["success"] += 1
+                stats["total_size"] += tool_result.output_size
+            else:
+                tool_failures[tool_name].append((result.schema_name, tool_result.error_message))
+            stats["total_time"] += tool_result.execution_time
     
     print("\n" + "="*80)
     print("JSON SCHEMA TO RUST BAKEOFF - HARD MODE (COMPLEX SCHEMAS ONLY)")
@@ -403,13 +427,7 @@ def print_summary_report(results: List[SchemaResult], include_schemafy: bool):
     print("\nFAILURE ANALYSIS (HARD SCHEMAS):")
     print("-" * 40)
     
-    for tool_name in tool_stats.keys():
-        failures = []
-        for result in results:
-            tool_result = getattr(result, tool_name)
-            if tool_result and not tool_result.success:
-                failures.append((result.schema_name, tool_result.error_message))
-        
+    for tool_name, failures in tool_failures.items():
         if failures:
             print(f"\n{tool_name.upper()} FAILURES ({len(failures)}):")
             for schema_name, error in failures[:3]:  # Show first 3 failures
@@ -456,8 +474,26 @@ def print_summary_report(results: List[SchemaResult], include_schemafy: bool):
     print(f"   🏗️  Deeply nested structures")
     print(f"   🔧 x-rust-type hints and transformations")
 
+def tool_available(cmd: List[str], verify: bool = False) -> bool:
+    """Check a tool is on PATH; with verify, also check that `--help` runs.
+    
+    Cargo subcommands are found through their `cargo-<name>` executables.
+    """
+    executables = [cmd[0], f"cargo-{cmd[1]}"] if cmd[0] == "cargo" else [cmd[0]]
+    if any(shutil.which(executable) is None for executable in executables):
+        return False
+    if verify:
+        success, _, _ = run_command(cmd + ["--help"], timeout=5)
+        return success
+    return True
+
 def main():
     """Main bakeoff execution - HARD MODE"""
+    parser = argparse.ArgumentParser(description="JSON Schema to Rust HARD MODE bakeoff")
+    parser.add_argument("--verify-tools", action="store_true",
+                        help="Run each tool's --help instead of only looking it up on PATH")
+    args = parser.parse_args()
+    
     print("💪 JSON Schema to Rust HARD MODE Bakeoff")
     print("Testing only the most complex schemas!")
     print()
@@ -487,16 +523,14 @@ def main():
     optional_tools = ["schemafy-cli"]
     
     # Check if cargo typify is available
-    success, _, _ = run_command(["cargo", "typify", "--help"], timeout=5)
-    if not success:
+    if not tool_available(["cargo", "typify"], args.verify_tools):
         print("❌ cargo typify not found. Install with: cargo install cargo-typify")
         tools_available = False
     else:
         print("✅ Tool available: cargo typify")
     
     for tool in required_tools[1:]:  # Skip cargo, already checked typify
-        success, _, _ = run_command([tool, "--help"], timeout=5)
-        if not success:
+        if not tool_available([tool], args.verify_tools):
             print(f"❌ Tool not available: {tool}")
             tools_available = False
         else:
@@ -505,8 +539,7 @@ def main():
     # Check optional tools
     include_schemafy = False
     for tool in optional_tools:
-        success, _, _ = run_command([tool, "--help"], timeout=5)
-        if not success:
+        if not tool_available([tool], args.verify_tools):
             print(f"⚠️  Optional tool not available: {tool}")
         else:
             print(f"✅ Optional tool available: {tool}")
@@ -522,20 +555,35 @@ def main():
     print("⚡ Testing: Entity polymorphism, physics variables, nested structures...")
     print()
     
-    # Run tests
-    results = []
+    # Run tests; schemas are independent, so fan them out across processes
+    results_by_schema = {}
     start_time = time.time()
     
-    for i, schema_file in enumerate(hard_schemas, 1):
-        print(f"[{i}/{len(hard_schemas)}] Testing {schema_file.name}")
-        result = test_schema_with_all_tools(str(schema_file), include_schemafy)
-        results.append(result)
-        
-        elapsed = time.time() - start_time
-        if i < len(hard_schemas):
-            estimated_total = (elapsed / i) * len(hard_schemas)
-            remaining = estimated_total - elapsed
-            print(f"  Progress: {i}/{len(hard_schemas)} ({i/len(hard_schemas)*100:.1f}%) - Est. {remaining/60:.1f}m remaining")
+    # One scratch tree for the whole run, removed once at the end
+    scratch_root = tempfile.mkdtemp(prefix='bakeoff-')
+    test_schema = partial(test_schema_with_all_tools, include_schemafy=include_schemafy,
+                          scratch_root=scratch_root)
+    try:
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            futures = {
+                executor.submit(test_schema, str(schema_file)): schema_file
+                for schema_file in hard_schemas
+            }
+            for i, future in enumerate(as_completed(futures), 1):
+                schema_file = futures[future]
+                results_by_schema[schema_file] = future.result()
+                print(f"[{i}/{len(hard_schemas)}] Tested {schema_file.name}")
+                
+                elapsed = time.time() - start_time
+                if i < len(hard_schemas):
+                    estimated_total = (elapsed / i) * len(hard_schemas)
+                    remaining = estimated_total - elapsed
+                    print(f"  Progress: {i}/{len(hard_schemas)} ({i/len(hard_schemas)*100:.1f}%) - Est. {remaining/60:.1f}m remaining")
+    finally:
+        shutil.rmtree(scratch_root, ignore_errors=True)
+    
+    # Report in selection order regardless of completion order
+    results = [results_by_schema[schema_file] for schema_file in hard_schemas]
     
     total_time = time.time() - start_time
     print(f"\n💪 HARD MODE bakeoff completed in {total_time:.1f} seconds")
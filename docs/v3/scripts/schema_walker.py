@@ -0,0 +1,32 @@
+"""
+Familiar v3: Shared single-pass JSON schema walker
+
+Schema fix-ups such as stripping typify-incompatible extensions or dropping
+panicking numeric constraints are all local to one dict node. Rather than
+walking the tree once per fix-up, scripts pass every rule to
+``walk_and_transform`` and the tree is traversed exactly once.
+"""
+
+from typing import Any, Callable, Sequence
+
+def walk_and_transform(node: Any, rules: Sequence[Callable[[dict], None]]) -> Any:
+    """Apply every rule, in order, to each dict in the tree, in place.
+
+    Rules run on a dict before its children are visited, so anything a rule
+    inserts is walked too. Returns ``node`` for convenience.
+    """
+    # Explicit stack instead of recursion; children are pushed in reverse so
+    # dicts are still visited in document (pre-)order
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, dict):
+            for rule in rules:
+                rule(current)
+            children = current.values()
+        elif isinstance(current, list):
+            children = current
+        else:
+            continue
+        stack.extend(child for child in reversed(children) if isinstance(child, (dict, list)))
+    return node
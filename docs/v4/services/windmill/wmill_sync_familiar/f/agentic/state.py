@@ -11,6 +11,8 @@ The canonical schemas live in `familiar-schemas/`. For Windmill:
 1. **Option A (Recommended)**: Use Windmill Resources
    - Store JSON schemas in Windmill Resources
    - Validate at runtime using `jsonschema` library
+   - Fast path: `compile_validator()` compiles a schema once (with
+     `fastjsonschema` when installed) and `validate_with_module()` uses it
 
 2. **Option B**: Bundle types in a pip package  
    - Publish `familiar-types` to private PyPI
@@ -22,9 +24,17 @@ The canonical schemas live in `familiar-schemas/`. For Windmill:
 
 See: https://www.windmill.dev/docs/advanced/imports
 """
-from typing import Dict, Any, Optional, Protocol, List
-from datetime import datetime
-from pydantic import BaseModel
+from typing import Callable, Dict, Any, Optional, Protocol, List
+from datetime import datetime, timezone
+from pydantic import BaseModel, ConfigDict
+
+# Optional: code-generating JSON Schema validator (Option A fast path)
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
+_UTC = timezone.utc
 
 # Try to import from bundled package (Option B) if available
 # Falls back to inline definitions (Option C) if not installed
@@ -39,6 +49,8 @@ except ImportError:
         
         Schema: familiar-schemas/versions/v0.7.0/json-schema/agentic/ConversationTurn.json
         """
+        model_config = ConfigDict(validate_assignment=False, extra="ignore")
+
         content: str
         role: str
         speaker: Optional[str] = None
@@ -49,6 +61,8 @@ except ImportError:
         
         Schema: familiar-schemas/versions/v0.7.0/json-schema/agentic/AgentState.json
         """
+        model_config = ConfigDict(validate_assignment=False, extra="ignore")
+
         conversation_context: List[ConversationTurn] = []
         current_speaker: Optional[str] = None
         is_authenticated: bool = False
@@ -78,6 +92,9 @@ REGISTERED_MODULES: Dict[str, AgentModule] = {
     # "physics": PhysicsModule(),
 }
 
+# Compiled JSON Schema validators, keyed by schema id / module name
+_VALIDATORS: Dict[str, Callable[[Dict[str, Any]], bool]] = {}
+
 
 def create_initial_state(tenant_id: str, thread_id: Optional[str] = None) -> AgentState:
     """Create initial state for a new conversation"""
@@ -94,11 +111,12 @@ def create_initial_state(tenant_id: str, thread_id: Optional[str] = None) -> Age
 
 def add_turn(state: AgentState, role: str, content: str) -> AgentState:
     """Add a conversation turn to the state"""
-    turn = ConversationTurn(
+    # Fields come from the runner itself, so skip validation
+    turn = ConversationTurn.model_construct(
         role=role,
         content=content,
         speaker=state.current_speaker,
-        timestamp=datetime.utcnow().isoformat() + "Z",
+        timestamp=datetime.now(_UTC).isoformat(timespec="milliseconds").replace("+00:00", "Z"),
     )
     state.conversation_context.append(turn)
     return state
@@ -125,7 +143,12 @@ def reset_finished(state: AgentState) -> AgentState:
 
 def serialize_state(state: AgentState) -> Dict[str, Any]:
     """Serialize state for Windmill flow passing"""
-    return state.model_dump()
+    return state.model_dump(mode="json")
+
+
+def serialize_state_json(state: AgentState) -> str:
+    """Serialize state straight to a JSON string (pydantic-core serializer)"""
+    return state.model_dump_json()
 
 
 def deserialize_state(data: Dict[str, Any]) -> AgentState:
@@ -133,8 +156,30 @@ def deserialize_state(data: Dict[str, Any]) -> AgentState:
     return AgentState.model_validate(data)
 
 
+def compile_validator(schema_id: str, schema_json: Dict[str, Any]) -> Callable[[Dict[str, Any]], bool]:
+    """Compile a JSON Schema once and register it under schema_id"""
+    if fastjsonschema is not None:
+        check = fastjsonschema.compile(schema_json)
+
+        def validate(data: Dict[str, Any]) -> bool:
+            try:
+                check(data)
+                return True
+            except fastjsonschema.JsonSchemaException:
+                return False
+    else:
+        from jsonschema.validators import validator_for
+        validate = validator_for(schema_json)(schema_json).is_valid
+
+    _VALIDATORS[schema_id] = validate
+    return validate
+
+
 def validate_with_module(module_name: str, data: Dict[str, Any]) -> bool:
-    """Validate data using a registered module"""
+    """Validate data using a compiled schema or a registered module"""
+    validator = _VALIDATORS.get(module_name)
+    if validator is not None:
+        return validator(data)
     if module_name not in REGISTERED_MODULES:
         return True  # No validation if module not registered
     return REGISTERED_MODULES[module_name].validate(data)